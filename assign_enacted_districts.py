@@ -3,26 +3,88 @@ assign_enacted_districts.py
 ===========================
 Assigns each voting precinct to its enacted congressional district using a
 representative-point-in-polygon spatial join, then writes the result back
-to a GeoJSON file.
+to a FlatGeobuf (internal pipeline stage) or GeoJSON file.
 
 Workflow
 --------
 1. Read precinct and district shapefiles / GeoJSON with GeoPandas.
-2. Buffer geometries to fix invalid polygons.
+2. Buffer invalid geometries to fix them (valid ones are left untouched);
+   the district layer, its repair and its STRtree are cached per path.
 3. Reproject precincts to the districts' CRS.
 4. Compute one representative point per precinct for a stable point-in-polygon join.
-5. Spatial join: precinct point -> district polygon (left join).
-6. Merge the assigned district ID back onto the full precinct GeoDataFrame.
+5. Query an STRtree of district polygons: precinct point -> district polygon.
+6. Write the assigned district ID onto the full precinct GeoDataFrame.
 7. Sanity-check for missing assignments and print diagnostics.
-8. Write the enriched GeoDataFrame to an output GeoJSON.
+8. Write the enriched GeoDataFrame; the format follows the output suffix
+   (.fgb -> FlatGeobuf, otherwise GeoJSON).
 
-Module-level script section (bottom of file) runs the pipeline for Alabama
-and Oregon, then casts the enacted_cd column to int.
+The `__main__` section (bottom of file) runs the pipeline for Alabama
+and Oregon. The enacted_cd column is cast to a (nullable) integer before
+writing, so no post-processing pass over the output is needed.
 
-Dependencies: geopandas
+The script writes FlatGeobuf because the output is only re-read by
+mergingData.py; binary coordinates are much smaller and faster to
+(de)serialize than GeoJSON text, and pyogrio writes them without any
+extra dependency.
+
+Dependencies: geopandas, shapely>=2.0, numpy, pyogrio
 """
 
+import os
+from functools import lru_cache
+
 import geopandas as gpd
+import numpy as np
+import shapely
+
+# Vectorized (whole-layer) reads/writes instead of per-feature fiona callbacks
+gpd.options.io_engine = "pyogrio"
+
+
+def write_gdf(gdf: gpd.GeoDataFrame, path: str):
+    """
+    Write a GeoDataFrame in the format implied by the file suffix:
+    .fgb -> FlatGeobuf, anything else -> GeoJSON.
+
+    FlatGeobuf is written without its spatial index (which would reorder
+    the features) and without promoting Polygons to MultiPolygons, so it
+    reads back row for row and shape for shape like the GeoJSON output.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".fgb":
+        gdf.to_file(path, driver="FlatGeobuf", SPATIAL_INDEX="NO", promote_to_multi=False)
+    else:
+        gdf.to_file(path, driver="GeoJSON")
+
+
+def _fix_invalid(gdf: gpd.GeoDataFrame):
+    """
+    Rebuild invalid polygons in place with buffer(0); valid ones are left as-is.
+    """
+    bad = ~gdf.geometry.is_valid
+    if bad.any():
+        gdf.loc[bad, "geometry"] = gdf.loc[bad, "geometry"].buffer(0)
+
+
+@lru_cache(maxsize=16)
+def _load_districts(districts_path: str):
+    """
+    Read, repair and index a district layer once per path.
+
+    Returns (districts, tree): the GeoDataFrame with valid geometries, already
+    prepared in place, and an STRtree over them. Repeat calls against the same
+    district file (e.g. re-running a state) skip the parse, repair and index
+    build. Callers must treat both as read-only.
+    """
+    districts = gpd.read_file(districts_path)
+    _fix_invalid(districts)
+
+    # Prepare the polygons once (in place) so every containment test reuses
+    # GEOS' cached edge index instead of re-scanning the rings
+    district_geoms = districts.geometry.values
+    shapely.prepare(district_geoms)
+    tree = shapely.STRtree(district_geoms)
+    return districts, tree
 
 
 def assign_enacted_districts(
@@ -32,55 +94,56 @@ def assign_enacted_districts(
     precinct_id_col: str,
     district_id_col: str,
     enacted_col: str = "enacted_cd",
+    verbose: bool = False,
 ):
     """
     Assign each precinct polygon to its enacted congressional district via
-    a representative-point spatial join and write the result to GeoJSON.
+    a representative-point spatial join and write the result to `out_path`.
 
     Parameters
     ----------
     precinct_path   : Path to the precinct shapefile or GeoJSON.
     districts_path  : Path to the congressional district shapefile or GeoJSON.
-    out_path        : Output path for the enriched precinct GeoJSON.
+    out_path        : Output path for the enriched precincts (.fgb or
+                      .geojson).
     precinct_id_col : Column name of the unique precinct identifier.
     district_id_col : Column name of the district identifier in the districts file.
     enacted_col     : Name of the output column to store the assigned district
                       (default: "enacted_cd").
+    verbose         : Print diagnostic counts when True.
     """
 
-    # Step 1: Read files (GeoPandas supports .shp and .geojson)
+    # Step 1: Read files (GeoPandas supports .shp and .geojson); the district
+    # layer and its spatial index come from a per-path cache
     precincts = gpd.read_file(precinct_path)
-    districts = gpd.read_file(districts_path)
+    districts, tree = _load_districts(districts_path)
 
-    # Step 2: Ensure valid geometries (helps prevent join errors)
-    precincts["geometry"] = precincts["geometry"].buffer(0)
-    districts["geometry"] = districts["geometry"].buffer(0)
+    # Step 2: Ensure valid geometries (helps prevent join errors). Only the
+    # invalid polygons are rebuilt; valid ones are left as-is.
+    _fix_invalid(precincts)
 
-    # Step 3: Put both into same CRS (use districts CRS as the "authority")
+    # Step 3: Put both into same CRS (use districts CRS as the "authority");
+    # skipped entirely when the inputs already match
     if precincts.crs != districts.crs:
         precincts = precincts.to_crs(districts.crs)
 
     # Step 4: Representative point for stable point-in-polygon assignment
-    pts = precincts[[precinct_id_col, "geometry"]].copy()
-    pts["geometry"] = pts.geometry.representative_point()
-
-    # Step 5: Spatial join: precinct point -> district polygon
-    joined = gpd.sjoin(
-        pts,
-        districts[[district_id_col, "geometry"]],
-        how="left",
-        predicate="within",
-    )
+    # (shapely.point_on_surface straight on the geometry array; no
+    # intermediate point GeoSeries)
+    rep_pts = shapely.point_on_surface(precincts.geometry.values)
 
-    # Step 6: Attach district id back onto full precinct polygons
-    precincts = precincts.merge(
-        joined[[precinct_id_col, district_id_col]],
-        on=precinct_id_col,
-        how="left",
-        validate="one_to_one",
-    )
+    # Step 5: Point-in-polygon via an STRtree over the district polygons.
+    # Returns (point index, district index) pairs for every point that falls
+    # within a district; a point on a shared edge keeps its first hit.
+    pt_idx, poly_idx = tree.query(rep_pts, predicate="within")
+    pt_idx, first = np.unique(pt_idx, return_index=True)
+    poly_idx = poly_idx[first]
 
-    precincts.rename(columns={district_id_col: enacted_col}, inplace=True)
+    # Step 6: Attach district id back onto full precinct polygons
+    # (unmatched precincts stay None and become null below)
+    assigned = np.full(len(precincts), None, dtype=object)
+    assigned[pt_idx] = districts[district_id_col].to_numpy()[poly_idx]
+    precincts[enacted_col] = assigned
 
     # Normalize enacted_cd to integer (safe conversion)
     precincts[enacted_col] = (
@@ -90,58 +153,55 @@ def assign_enacted_districts(
     )
     precincts[enacted_col] = gpd.pd.to_numeric(precincts[enacted_col], errors="coerce")
 
-    # Diagnostics
-    print("Missing enacted_cd:", int(precincts[enacted_col].isna().sum()))
-
-    print("Missing enacted_cd:", int(precincts[enacted_col].isna().sum()))
-    print("Min enacted_cd:", precincts[enacted_col].min())
-    print("Max enacted_cd:", precincts[enacted_col].max())
-    print("Counts per enacted_cd:\n", precincts[enacted_col].value_counts(dropna=False).sort_index())
+    # Cast in memory so the output is written with integer ids in one pass
+    # (nullable Int64 keeps any unassigned precincts as null)
+    precincts[enacted_col] = precincts[enacted_col].astype("Int64")
 
-    # Step 7: Quick sanity checks
-    missing = precincts[precincts[enacted_col].isna()]
-    if len(missing) > 0:
-        print(f"WARNING: {len(missing)} precincts did not get an enacted district.")
-        print(missing[[precinct_id_col]].head(10))
+    # Diagnostics
+    if verbose:
+        print("Missing enacted_cd:", int(precincts[enacted_col].isna().sum()))
+        print("Min enacted_cd:", precincts[enacted_col].min())
+        print("Max enacted_cd:", precincts[enacted_col].max())
+        print("Counts per enacted_cd:\n", precincts[enacted_col].value_counts(dropna=False).sort_index())
+
+        # Step 7: Quick sanity checks
+        missing = precincts[precincts[enacted_col].isna()]
+        if len(missing) > 0:
+            print(f"WARNING: {len(missing)} precincts did not get an enacted district.")
+            print(missing[[precinct_id_col]].head(10))
 
     # Step 8: Save
-    precincts.to_file(out_path, driver="GeoJSON")
-    print(f"Saved: {out_path}")
-    print("Unique enacted districts:", sorted(precincts[enacted_col].dropna().unique()))
-
-
-# ── Script entry: Alabama ─────────────────────────────────────────────────
-# precincts = gpd.read_file("AL-precincts-with-results.geojson")
-# districts = gpd.read_file("AL_Congressional_Districts_Shapefile/SP_Remedial_Plan_3 2023-10-05.shp")
-# print(districts.columns)
-# print(precincts.columns)
-assign_enacted_districts(
-    precinct_path="BASE_FILES/AL-precincts-with-results.geojson",
-    districts_path="BASE_FILES/AL_Congressional_Districts_Shapefile/SP_Remedial_Plan_3 2023-10-05.shp",
-    out_path="AL_data/AL-precincts-with-results-enacted.geojson",
-    precinct_id_col="GEOID",
-    district_id_col="DISTRICT",
-)
-
-# ── Script entry: Oregon ──────────────────────────────────────────────────
-# precincts = gpd.read_file("OR-precincts-with-results.geojson")
-# districts = gpd.read_file("OR_Congressional_Districts.geojson")
-# print(districts.columns)
-# print(precincts.columns)
-assign_enacted_districts(
-    precinct_path="BASE_FILES/OR-precincts-with-results.geojson",
-    districts_path="BASE_FILES/OR_Congressional_Districts.geojson",
-    out_path="OR_data/OR-precincts-with-results-enacted.geojson",
-    precinct_id_col="GEOID",
-    district_id_col="DISTRICT",
-)
-
-# ── Post-process: cast enacted_cd to int for AL ───────────────────────────
-al = gpd.read_file("AL_data/AL-precincts-with-results-enacted.geojson")
-al["enacted_cd"] = al["enacted_cd"].astype(int)
-al.to_file("AL_data/AL-precincts-with-results-enacted.geojson", driver="GeoJSON")
-
-# ── Post-process: cast enacted_cd to int for OR ───────────────────────────
-or_ = gpd.read_file("OR_data/OR-precincts-with-results-enacted.geojson")
-or_["enacted_cd"] = or_["enacted_cd"].astype(int)
-or_.to_file("OR_data/OR-precincts-with-results-enacted.geojson", driver="GeoJSON")
+    write_gdf(precincts, out_path)
+    if verbose:
+        print(f"Saved: {out_path}")
+        print("Unique enacted districts:", sorted(precincts[enacted_col].dropna().unique()))
+
+
+if __name__ == "__main__":
+    # ── Script entry: Alabama ─────────────────────────────────────────────────
+    # precincts = gpd.read_file("AL-precincts-with-results.geojson")
+    # districts = gpd.read_file("AL_Congressional_Districts_Shapefile/SP_Remedial_Plan_3 2023-10-05.shp")
+    # print(districts.columns)
+    # print(precincts.columns)
+    assign_enacted_districts(
+        precinct_path="BASE_FILES/AL-precincts-with-results.geojson",
+        districts_path="BASE_FILES/AL_Congressional_Districts_Shapefile/SP_Remedial_Plan_3 2023-10-05.shp",
+        out_path="AL_data/AL-precincts-with-results-enacted.fgb",
+        precinct_id_col="GEOID",
+        district_id_col="DISTRICT",
+        verbose=True,
+    )
+
+    # ── Script entry: Oregon ──────────────────────────────────────────────────
+    # precincts = gpd.read_file("OR-precincts-with-results.geojson")
+    # districts = gpd.read_file("OR_Congressional_Districts.geojson")
+    # print(districts.columns)
+    # print(precincts.columns)
+    assign_enacted_districts(
+        precinct_path="BASE_FILES/OR-precincts-with-results.geojson",
+        districts_path="BASE_FILES/OR_Congressional_Districts.geojson",
+        out_path="OR_data/OR-precincts-with-results-enacted.fgb",
+        precinct_id_col="GEOID",
+        district_id_col="DISTRICT",
+        verbose=True,
+    )
@@ -1,7 +1,11 @@
 import json
+import shutil
 import geopandas as gpd
 import pandas as pd
 
+# Vectorized (whole-layer) reads/writes instead of per-feature fiona callbacks
+gpd.options.io_engine = "pyogrio"
+
 def attach_baseline_to_official_districts(
     districts_geojson_path: str,
     baseline_json_path: str,
@@ -18,44 +22,42 @@ def attach_baseline_to_official_districts(
     with open(baseline_json_path, "r") as f:
         baseline = json.load(f)
 
-    # Convert baseline["districts"] dict -> dataframe
-    rows = []
-    for d_str, info in baseline["districts"].items():
-        d = int(d_str)
-        rows.append({
-            district_col: d,
-            "population_calc": info.get("population"),
-            "votes_dem": info.get("votes_dem"),
-            "votes_rep": info.get("votes_rep"),
-            "winner": info.get("winner"),
-            "dem_share": info.get("dem_share"),
-        })
-    stats = pd.DataFrame(rows)
+    # Convert baseline["districts"] dict -> dataframe in one construction
+    # (keys are district ids as strings; reindex keeps absent fields as null)
+    stats = (
+        pd.DataFrame.from_dict(baseline["districts"], orient="index")
+        .reindex(columns=["population", "votes_dem", "votes_rep", "winner", "dem_share"])
+        .rename(columns={"population": "population_calc"})
+    )
+    stats.index = stats.index.astype(int)
+    stats = stats.rename_axis(district_col).reset_index()
 
     # Merge and write
     out = gdf.merge(stats, on=district_col, how="left", validate="one_to_one")
     out.to_file(out_geojson_path, driver="GeoJSON")
-    out.to_file(out_geojson_path2, driver="GeoJSON")
+    # Second destination gets the identical bytes; no need to serialize twice
+    shutil.copyfile(out_geojson_path, out_geojson_path2)
 
     print("Saved:", out_geojson_path)
     print("District rows:", len(out))
     print("Missing stats rows:", int(out["votes_dem"].isna().sum()))
     print("District ids in output:", sorted(out[district_col].dropna().astype(int).unique().tolist()))
 
-# AL
-attach_baseline_to_official_districts(
-    districts_geojson_path="BASE_FILES/AL_Congressional_Districts_Shapefile/SP_Remedial_Plan_3 2023-10-05.shp",
-    baseline_json_path="AL_data/AL_enacted_baseline.json",
-    out_geojson_path="AL_data/AL_enacted_districts_with_stats.geojson",
-    out_geojson_path2="seawulf_runs/AL/input/AL_enacted_districts_with_stats.geojson",
-    district_col="DISTRICT",
-)
-
-# OR
-attach_baseline_to_official_districts(
-    districts_geojson_path="BASE_FILES/OR_Congressional_Districts.geojson",
-    baseline_json_path="OR_data/OR_enacted_baseline.json",
-    out_geojson_path="OR_data/OR_enacted_districts_with_stats.geojson",
-    out_geojson_path2="seawulf_runs/OR/input/OR_enacted_districts_with_stats.geojson",
-    district_col="DISTRICT",
-)
\ No newline at end of file
+if __name__ == "__main__":
+    # AL
+    attach_baseline_to_official_districts(
+        districts_geojson_path="BASE_FILES/AL_Congressional_Districts_Shapefile/SP_Remedial_Plan_3 2023-10-05.shp",
+        baseline_json_path="AL_data/AL_enacted_baseline.json",
+        out_geojson_path="AL_data/AL_enacted_districts_with_stats.geojson",
+        out_geojson_path2="seawulf_runs/AL/input/AL_enacted_districts_with_stats.geojson",
+        district_col="DISTRICT",
+    )
+
+    # OR
+    attach_baseline_to_official_districts(
+        districts_geojson_path="BASE_FILES/OR_Congressional_Districts.geojson",
+        baseline_json_path="OR_data/OR_enacted_baseline.json",
+        out_geojson_path="OR_data/OR_enacted_districts_with_stats.geojson",
+        out_geojson_path2="seawulf_runs/OR/input/OR_enacted_districts_with_stats.geojson",
+        district_col="DISTRICT",
+    )
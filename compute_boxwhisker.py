@@ -4,6 +4,9 @@ from pathlib import Path
 import geopandas as gpd
 import numpy as np
 
+# Vectorized (whole-layer) reads/writes instead of per-feature fiona callbacks
+gpd.options.io_engine = "pyogrio"
+
 
 ROOT = Path(__file__).resolve().parent
 
@@ -147,20 +150,30 @@ def compute_boxwhisker_from_raw(plans):
     District rank means the sorted district minority percentages in each plan.
     """
     num_ranks = len(plans[0]["district_pcts_sorted"])
-    per_rank = [[] for _ in range(num_ranks)]
-
-    for plan in plans:
-        vals = plan["district_pcts_sorted"]
-        if len(vals) != num_ranks:
-            raise ValueError("Inconsistent district_pcts_sorted lengths across plans")
-        for i, v in enumerate(vals):
-            per_rank[i].append(v)
-
-    stats = []
-    for i, values in enumerate(per_rank, start=1):
-        row = {"district_rank": i}
-        row.update(quantile_stats(values))
-        stats.append(row)
+    if any(len(plan["district_pcts_sorted"]) != num_ranks for plan in plans):
+        raise ValueError("Inconsistent district_pcts_sorted lengths across plans")
+
+    # One (num_plans, num_ranks) matrix; every statistic is a column-wise
+    # reduction over axis 0 instead of a per-rank Python list
+    arr = np.array([plan["district_pcts_sorted"] for plan in plans], dtype=float)
+    mins = arr.min(axis=0)
+    q1s, medians, q3s = np.quantile(arr, [0.25, 0.50, 0.75], axis=0)
+    maxs = arr.max(axis=0)
+
+    stats = [
+        {
+            "district_rank": i,
+            "min": float(lo),
+            "q1": float(q1),
+            "median": float(med),
+            "q3": float(q3),
+            "max": float(hi),
+        }
+        for i, (lo, q1, med, q3, hi) in enumerate(
+            zip(mins.tolist(), q1s.tolist(), medians.tolist(), q3s.tolist(), maxs.tolist()),
+            start=1,
+        )
+    ]
 
     return stats
 
@@ -170,9 +183,16 @@ def compute_enacted_points(precinct_geojson: Path, group_col: str, pop_col: str
     Computes enacted district minority percentages and returns them sorted by percentage,
     so they align with the rank-based boxplots.
     """
-    gdf = gpd.read_file(precinct_geojson)
-
     required = {"enacted_cd", group_col, pop_col}
+
+    # Only the three tally columns are used: skip geometry and every other
+    # property at the reader (absent columns are simply not returned)
+    gdf = gpd.read_file(
+        precinct_geojson,
+        columns=sorted(required),
+        ignore_geometry=True,
+    )
+
     missing = [c for c in required if c not in gdf.columns]
     if missing:
         raise ValueError(f"Missing columns in {precinct_geojson}: {missing}")
@@ -181,15 +201,16 @@ def compute_enacted_points(precinct_geojson: Path, group_col: str, pop_col: str
     grouped["pct"] = grouped[group_col] / grouped[pop_col]
     grouped = grouped.sort_values("pct").reset_index(drop=True)
 
-    enacted_points = []
-    for i, row in grouped.iterrows():
-        enacted_points.append(
-            {
-                "district_rank": int(i + 1),
-                "enacted_cd": int(row["enacted_cd"]),
-                "pct": float(row["pct"]),
-            }
+    enacted_points = [
+        {
+            "district_rank": rank,
+            "enacted_cd": int(cd),
+            "pct": float(pct),
+        }
+        for rank, (cd, pct) in enumerate(
+            zip(grouped["enacted_cd"].tolist(), grouped["pct"].tolist()), start=1
         )
+    ]
 
     return enacted_points
 
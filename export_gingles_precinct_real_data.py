@@ -267,7 +267,8 @@ def build_points(
         & (gdf[minority_col] <= gdf["VAP"])
     )
 
-    g = gdf.loc[mask].copy()
+    # Read-only view of the qualifying rows; no need to deep-copy the frame
+    g = gdf.loc[mask]
 
     for _, row in g.iterrows():
         total_pop = int(row["VAP"])
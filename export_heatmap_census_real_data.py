@@ -67,7 +67,10 @@ def pct_to_bin_id(pct_0_to_100: float, bins: list[dict]) -> int:
 
 
 def load_block_vap(vap_csv_path: Path) -> pd.DataFrame:
-    pop = pd.read_csv(vap_csv_path, skiprows=[1], dtype=str)
+    # The P4 table is a few hundred columns wide; parse only GEO_ID and the
+    # six counts used below
+    keep = {"GEO_ID", "P4_001N", "P4_002N", "P4_003N", "P4_005N", "P4_006N", "P4_008N"}
+    pop = pd.read_csv(vap_csv_path, skiprows=[1], dtype=str, usecols=lambda c: c in keep)
 
     pop["GEOID_BLOCK"] = (
         pop["GEO_ID"]
@@ -104,14 +107,24 @@ def load_block_vap(vap_csv_path: Path) -> pd.DataFrame:
 def build_features(merged: gpd.GeoDataFrame, bins: list[dict]) -> list[dict]:
     features = []
 
-    for idx, row in merged.reset_index(drop=True).iterrows():
-        vap_total = int(row["VAP"])
+    # Walk plain column lists instead of iterrows (no per-row Series).
+    rows = zip(
+        merged["VAP"].tolist(),
+        merged["NH_BLACK_ALONE_VAP"].tolist(),
+        merged["NH_WHITE_ALONE_VAP"].tolist(),
+        merged["LATINO_VAP"].tolist(),
+        merged["NH_ASIAN_ALONE_VAP"].tolist(),
+        merged["OTHER_VAP"].tolist(),
+    )
+
+    for idx, (vap_total, black, white, hispanic, asian, other) in enumerate(rows):
+        vap_total = int(vap_total)
 
-        black_pct = safe_pct(row["NH_BLACK_ALONE_VAP"], vap_total)
-        white_pct = safe_pct(row["NH_WHITE_ALONE_VAP"], vap_total)
-        hispanic_pct = safe_pct(row["LATINO_VAP"], vap_total)
-        asian_pct = safe_pct(row["NH_ASIAN_ALONE_VAP"], vap_total)
-        other_pct = safe_pct(row["OTHER_VAP"], vap_total)
+        black_pct = safe_pct(black, vap_total)
+        white_pct = safe_pct(white, vap_total)
+        hispanic_pct = safe_pct(hispanic, vap_total)
+        asian_pct = safe_pct(asian, vap_total)
+        other_pct = safe_pct(other, vap_total)
 
         features.append(
             {
@@ -70,16 +70,32 @@ def pct_to_bin_id(pct_0_to_100: float, bins: list[dict]) -> int:
     return bins[-1]["binId"]
 
 
+def column_values(gdf: gpd.GeoDataFrame, col: str, default=0) -> list:
+    if col not in gdf.columns:
+        return [default] * len(gdf)
+    return gdf[col].tolist()
+
+
 def build_features(gdf: gpd.GeoDataFrame, bins: list[dict]) -> list[dict]:
     features = []
 
-    for idx, row in gdf.iterrows():
-        vap = float(row["VAP"]) if "VAP" in row and row["VAP"] is not None else 0.0
-
-        black_pct = safe_pct(row.get("NH_BLACK_ALONE_VAP", 0), vap)
-        white_pct = safe_pct(row.get("NH_WHITE_ALONE_VAP", 0), vap)
-        hispanic_pct = safe_pct(row.get("LATINO_VAP", 0), vap)
-        other_pct = safe_pct(row.get("OTHER_VAP", 0), vap)
+    # Walk plain column lists instead of iterrows (no per-row Series).
+    rows = zip(
+        gdf.index.tolist(),
+        column_values(gdf, "VAP", default=None),
+        column_values(gdf, "NH_BLACK_ALONE_VAP"),
+        column_values(gdf, "NH_WHITE_ALONE_VAP"),
+        column_values(gdf, "LATINO_VAP"),
+        column_values(gdf, "OTHER_VAP"),
+    )
+
+    for idx, vap, black, white, hispanic, other in rows:
+        vap = float(vap) if vap is not None else 0.0
+
+        black_pct = safe_pct(black, vap)
+        white_pct = safe_pct(white, vap)
+        hispanic_pct = safe_pct(hispanic, vap)
+        other_pct = safe_pct(other, vap)
 
         features.append(
             {
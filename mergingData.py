@@ -31,47 +31,72 @@ Pipeline (executed in __main__ block)
    nearest-neighbor imputation for precincts that fall outside all tract
    polygons.
 
+Stage 1 can return a PrecinctContext (projected + cleaned precincts and their
+representative points) that stages 2 and 3 accept via `context=`, so the
+reprojection, geometry repair and representative_point work is done once per state.
+The projected tract layer used by stages 2 and 3 is likewise cached per
+(path, CRS), so the tract file is read and reprojected once.
+
+run_state() runs the three stages for one state. With `cache_dir` set it
+also snapshots each stage's result (_cached_stage), keyed by the
+modification times of that stage's inputs, so a re-run only redoes the
+stages whose inputs changed. The __main__ block runs AL and OR in parallel
+processes, then prints QA for both.
+
 QA helpers (qa, qa_region, qa_income) print diagnostic summaries for each
 output GeoDataFrame.
 
-Dependencies: re, pandas, geopandas
+Dependencies: csv, re, numpy, pandas, geopandas, pyogrio
 """
 
+import csv
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import zip_longest
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+import pyogrio
+import shapely
+
+# Vectorized (whole-layer) reads/writes instead of per-feature fiona callbacks
+gpd.options.io_engine = "pyogrio"
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────
 
-def _safe_str(x) -> str:
+def _make_valid(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
-    Safely convert a value to a stripped string.
-    Returns an empty string for None or float NaN.
+    Repair invalid geometries in place with shapely.make_valid. Valid rows
+    (nearly all of them) are left untouched, so no per-feature rebuild is
+    paid for them.
 
     Parameters
     ----------
-    x : any
-        Value to convert.
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame to repair (modified in place).
 
     Returns
     -------
-    str
-        Stripped string representation, or "" for None / NaN.
+    gpd.GeoDataFrame
+        The same GeoDataFrame, for chaining.
     """
-    if x is None:
-        return ""
-    if isinstance(x, float) and pd.isna(x):
-        return ""
-    s = str(x)
-    return s.strip()
+    invalid = ~gdf.geometry.is_valid
+    if invalid.any():
+        gdf.loc[invalid, "geometry"] = shapely.make_valid(gdf.geometry.values[invalid.to_numpy()])
+    return gdf
 
 
 def _to_int_series(s: pd.Series) -> pd.Series:
     """
-    Coerce a pandas Series to integers, filling unparseable values with 0.
+    Coerce a pandas Series to int32, filling unparseable values with 0.
+    Counts (VAP, votes) and dollar incomes all fit comfortably in 32 bits.
 
     Parameters
     ----------
@@ -81,15 +106,47 @@ def _to_int_series(s: pd.Series) -> pd.Series:
     Returns
     -------
     pd.Series
-        Integer Series with NaN replaced by 0.
+        int32 Series with NaN replaced by 0.
+    """
+    # Plain numpy integer columns (e.g. aggregated counts) cannot hold NaN or
+    # junk, so they skip the to_numeric / fillna passes
+    if isinstance(s.dtype, np.dtype) and s.dtype.kind in "iu":
+        return s.astype(np.int32, copy=False)
+    return pd.to_numeric(s, errors="coerce").fillna(0).astype(np.int32)
+
+
+def _to_int_frame(df: pd.DataFrame) -> np.ndarray:
+    """
+    Coerce every column of a DataFrame to int32 at once, filling unparseable
+    values with 0 (the whole-table counterpart of `_to_int_series`).
+
+    Numeric columns are read as one float64 block; if any column holds text
+    (e.g. "-" or "" in Census tables), all values are flattened and parsed by
+    a single pd.to_numeric call instead of one call per column.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Columns to convert.
+
+    Returns
+    -------
+    np.ndarray
+        int32 array of shape (len(df), len(df.columns)), NaN replaced by 0.
     """
-    return pd.to_numeric(s, errors="coerce").fillna(0).astype(int)
+    if all(pd.api.types.is_numeric_dtype(t) for t in df.dtypes):
+        nums = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        arr = df.to_numpy(dtype=object)
+        nums = pd.to_numeric(arr.ravel(), errors="coerce").reshape(arr.shape).astype(np.float64)
+    return np.nan_to_num(nums, nan=0.0).astype(np.int32)
 
 
 def _col_or_zero(df: pd.DataFrame, col: Optional[str]):
     """
-    Return a DataFrame column by name, or the integer 0 if the column is
-    None or not present in the DataFrame.
+    Return a DataFrame column by name, or an int32 0 if the column is
+    None or not present in the DataFrame (so a broadcast zero column has
+    the same int32 width as the real count columns).
 
     Parameters
     ----------
@@ -98,10 +155,87 @@ def _col_or_zero(df: pd.DataFrame, col: Optional[str]):
 
     Returns
     -------
-    pd.Series or int
+    pd.Series or np.int32
         The named column, or 0.
     """
-    return df[col] if (col is not None and col in df.columns) else 0
+    return df[col] if (col is not None and col in df.columns) else np.int32(0)
+
+
+def _point_in_polygon(points, poly_gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """
+    For each point, return the position (iloc) of the polygon in `poly_gdf`
+    that contains it, using one bulk "within" query on its spatial index (no
+    sjoin frame/merge). A point on a shared edge keeps its first hit; points
+    outside every polygon get -1.
+
+    Parameters
+    ----------
+    points   : array-like        Query points (e.g. GeoSeries.values).
+    poly_gdf : gpd.GeoDataFrame  Polygons (its cached sindex is reused).
+
+    Returns
+    -------
+    np.ndarray
+        int64 positions into poly_gdf, -1 where no polygon contains the point.
+    """
+    pt_idx, poly_idx = poly_gdf.sindex.query(points, predicate="within")
+    pt_first, first = np.unique(pt_idx, return_index=True)
+    pos = np.full(len(points), -1, dtype=np.int64)
+    pos[pt_first] = poly_idx[first]
+    return pos
+
+
+def _nearest_positions(tree_gdf: gpd.GeoDataFrame, geoms) -> np.ndarray:
+    """
+    For each query geometry, return the position (iloc) of the nearest
+    geometry in `tree_gdf`, using one bulk query on its spatial index.
+    Equidistant ties keep the first hit, as sjoin_nearest + drop-duplicate
+    index does; queries with no result (null geometry) get -1.
+
+    Parameters
+    ----------
+    tree_gdf : gpd.GeoDataFrame  Candidates (its cached sindex is reused).
+    geoms    : array-like        Query geometries (e.g. GeoSeries.values).
+
+    Returns
+    -------
+    np.ndarray
+        int64 positions into tree_gdf, -1 where nothing was found.
+    """
+    in_idx, tree_idx = tree_gdf.sindex.nearest(geoms, return_all=True)
+    in_first, first = np.unique(in_idx, return_index=True)
+    pos = np.full(len(geoms), -1, dtype=np.int64)
+    pos[in_first] = tree_idx[first]
+    return pos
+
+
+@lru_cache(maxsize=8)
+def _load_tracts(tracts_path: str, target_crs: str, tract_geoid_col: str = "GEOID") -> gpd.GeoDataFrame:
+    """
+    Read a Census tract layer once per (path, CRS, id column): keep a
+    zero-padded TRACT_ID plus geometry, reproject to `target_crs` and repair
+    invalid polygons. The RUCA and income stages read the same tract file,
+    so the second call (and any re-run in the same session) skips the parse,
+    reprojection, repair and STRtree build. Callers must treat the result as
+    read-only and join against it directly (a column subset would drop the
+    cached spatial index).
+
+    Parameters
+    ----------
+    tracts_path     : str  Path to the tract shapefile / GeoJSON.
+    target_crs      : str  CRS to project into.
+    tract_geoid_col : str  Column holding the tract GEOID.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        Columns TRACT_ID and geometry, in `target_crs`.
+    """
+    tracts = gpd.read_file(tracts_path, columns=[tract_geoid_col])
+    tracts["TRACT_ID"] = tracts[tract_geoid_col].astype(str).str.strip().str.zfill(11)
+    tracts = _make_valid(tracts[["TRACT_ID", "geometry"]].to_crs(target_crs))
+    tracts.sindex  # build the STRtree now so it is cached with the frame
+    return tracts
 
 
 def _print_vap_balance(prefix: str, blocks_df: gpd.GeoDataFrame, prec_df: gpd.GeoDataFrame):
@@ -123,10 +257,17 @@ def _print_vap_balance(prefix: str, blocks_df: gpd.GeoDataFrame, prec_df: gpd.Ge
         print(f"{prefix} Difference (prec - blocks): {p - b}")
 
 
-def _apply_feasible_race_collapse(prec_df: gpd.GeoDataFrame, state_code: str) -> gpd.GeoDataFrame:
+def _feasible_other_vap(
+    state_code: str,
+    vap: np.ndarray,
+    latino: np.ndarray,
+    white: np.ndarray,
+    black: np.ndarray,
+) -> np.ndarray:
     """
-    Collapse race fields to feasible sets WITHOUT renaming columns,
-    so downstream configs remain compatible.
+    Collapse race fields to the state's feasible set and return OTHER_VAP
+    (everyone outside the kept groups, floored at 0). The kept columns are
+    not renamed, so downstream configs remain compatible.
 
     AL:
         keep NH_WHITE_ALONE_VAP
@@ -138,35 +279,86 @@ def _apply_feasible_race_collapse(prec_df: gpd.GeoDataFrame, state_code: str) ->
         keep NH_WHITE_ALONE_VAP
         OTHER_VAP = VAP - latino - white
     """
-
-    out = prec_df.copy()
     state_code = state_code.upper()
 
-    for c in ["VAP", "LATINO_VAP", "NH_WHITE_ALONE_VAP", "NH_BLACK_ALONE_VAP"]:
-        if c not in out.columns:
-            out[c] = 0
-        out[c] = pd.to_numeric(out[c], errors="coerce").fillna(0).astype(int)
-
     if state_code == "AL":
         # collapse everything except white + black
-        out["OTHER_VAP"] = (
-            out["VAP"]
-            - out["NH_WHITE_ALONE_VAP"]
-            - out["NH_BLACK_ALONE_VAP"]
-        ).clip(lower=0).astype(int)
+        return np.maximum(vap - white - black, 0)
 
-    elif state_code == "OR":
+    if state_code == "OR":
         # collapse everything except latino + white
-        out["OTHER_VAP"] = (
-            out["VAP"]
-            - out["LATINO_VAP"]
-            - out["NH_WHITE_ALONE_VAP"]
-        ).clip(lower=0).astype(int)
+        return np.maximum(vap - latino - white, 0)
 
-    else:
-        raise ValueError(f"Unsupported state_code {state_code}")
+    raise ValueError(f"Unsupported state_code {state_code}")
 
-    return out
+
+# ── Shared projected-precinct context ─────────────────────────────────────
+
+@dataclass
+class PrecinctContext:
+    """
+    Projected, cleaned precinct geometries and their representative points,
+    computed once and shared by the VAP, RUCA and income stages.
+
+    Attributes
+    ----------
+    prec_proj  : gpd.GeoDataFrame  Precincts in `target_crs`, invalid
+                                   geometries repaired.
+    rep_pts    : gpd.GeoSeries     representative_point() of prec_proj
+                                   (same index).
+    target_crs : str               CRS both were computed in.
+    tract_pos  : dict              Point-in-tract positions of rep_pts, keyed
+                                   by (tracts_path, tract_geoid_col); filled
+                                   by _tract_positions.
+    """
+    prec_proj: gpd.GeoDataFrame
+    rep_pts: gpd.GeoSeries
+    target_crs: str
+    tract_pos: dict = field(default_factory=dict)
+
+
+def _precinct_context(
+    precincts_gdf: gpd.GeoDataFrame,
+    target_crs: str,
+    context: Optional[PrecinctContext] = None,
+) -> PrecinctContext:
+    """
+    Return `context` when it was computed for the same CRS and rows (index) as
+    `precincts_gdf`; otherwise reproject, clean and compute representative
+    points from scratch.
+    """
+    if (
+        context is not None
+        and context.target_crs == target_crs
+        and context.prec_proj.index.equals(precincts_gdf.index)
+    ):
+        return context
+
+    prec_proj = precincts_gdf.to_crs(target_crs).copy()
+    _make_valid(prec_proj)
+    return PrecinctContext(
+        prec_proj=prec_proj,
+        rep_pts=gpd.GeoSeries(
+            shapely.point_on_surface(prec_proj.geometry.values),
+            index=prec_proj.index,
+            crs=prec_proj.crs,
+        ),
+        target_crs=target_crs,
+    )
+
+
+def _tract_positions(context: PrecinctContext, tracts_path: str, tract_geoid_col: str) -> np.ndarray:
+    """
+    Position (iloc into the cached tract layer) of the tract containing each
+    precinct's representative point, -1 when outside every tract. The query
+    runs once per context and tract file, so the RUCA and income stages share
+    a single point-in-tract pass. Callers must copy before modifying.
+    """
+    key = (tracts_path, tract_geoid_col)
+    if key not in context.tract_pos:
+        tracts = _load_tracts(tracts_path, context.target_crs, tract_geoid_col)
+        context.tract_pos[key] = _point_in_polygon(context.rep_pts.values, tracts)
+    return context.tract_pos[key]
 
 
 # ── Main: Build precinct geojson with VAP groups ──────────────────────────
@@ -175,7 +367,7 @@ def build_precinct_geojson_with_vap(
     vap_csv_path: str,
     blocks_shp_path: str,
     precincts_geojson_path: str,
-    output_geojson_path: str,
+    output_geojson_path: Optional[str],
     *,
     state_code: str,
     # column names
@@ -184,8 +376,10 @@ def build_precinct_geojson_with_vap(
 
     # spatial join settings
     target_crs: str = "EPSG:5070",
+    clip_blocks_to_precincts: bool = False,
     verbose: bool = False,
-) -> gpd.GeoDataFrame:
+    return_context: bool = False,
+):
     """
     Read block-level VAP CSV + block geometries, merge VAP into blocks,
     assign blocks to precincts using representative_point spatial join (with
@@ -217,69 +411,100 @@ def build_precinct_geojson_with_vap(
     vap_csv_path           : Path to the Census P.L. 94-171 redistricting
                              CSV with block-level VAP data.
     blocks_shp_path        : Path to the Census TIGER block shapefile (.shp).
-    precincts_geojson_path : Path to the input precinct GeoJSON (must already
-                             have enacted_cd from assign_enacted_districts.py).
-    output_geojson_path    : Destination path for the enriched precinct GeoJSON.
+    precincts_geojson_path : Path to the input precinct FlatGeobuf / GeoJSON
+                             (must already have enacted_cd from
+                             assign_enacted_districts.py).
+    output_geojson_path    : Destination path for the enriched precinct GeoJSON,
+                             or None to skip the write (e.g. when a later
+                             stage writes the final file).
     state_code             : Two-letter state code ("AL" or "OR") controlling
                              feasible-race collapse.
     blocks_geoid_col       : Column name of the block GEOID in the shapefile.
     precinct_id_col        : Column name of the precinct identifier.
     target_crs             : EPSG code for the projected CRS used during joins.
+    clip_blocks_to_precincts : Read only blocks whose extent overlaps the
+                             precincts' bounding box. Blocks outside it are
+                             then dropped instead of being assigned to their
+                             nearest precinct, so leave this off unless the
+                             block layer covers much more than the precincts.
     verbose                : Print diagnostic counts when True.
+    return_context         : Also return the PrecinctContext (projected
+                             precincts + representative points) so the
+                             RUCA and income stages can skip recomputing it.
 
     Returns
     -------
-    gpd.GeoDataFrame
-        Enriched precinct GeoDataFrame (also written to output_geojson_path).
+    gpd.GeoDataFrame, or (gpd.GeoDataFrame, PrecinctContext) when return_context
+        Enriched precinct GeoDataFrame (also written to output_geojson_path
+        unless it is None).
     """
 
     # ── Step A: Read block VAP CSV ────────────────────────────────────────
-    pop = pd.read_csv(vap_csv_path, skiprows=[1], dtype=str)
-
-    # Step A-1: Build 15-digit block GEOID from GEO_ID
-    pop["GEOID_BLOCK"] = (
-        pop["GEO_ID"]
-        .astype(str)
-        .str.replace("1000000US", "", regex=False)
-        .str.strip()
-        .str.zfill(15)
-    )
-
-    # Step A-2: Base VAP columns: total, HVAP, NHVAP
+    # Step A-1: Base VAP columns: total, HVAP, NHVAP
     base_cols = ["P4_001N", "P4_002N", "P4_003N"]
 
-    # Step A-3: Build label map from first 2 rows (ID row + label row)
-    hdr = pd.read_csv(vap_csv_path, header=None, nrows=2)
-    col_ids = hdr.iloc[0].tolist()
-    labels = hdr.iloc[1].tolist()
-    label_map = {_safe_str(cid): _safe_str(lab) for cid, lab in zip(col_ids, labels) if _safe_str(cid)}
-
-    def nh_alone_col(race_phrase: str) -> Optional[str]:
-        """
-        Find the P4_* column ID matching:
-          'Not Hispanic or Latino: <race_phrase> alone'
-        Excludes combination/multi-race lines by requiring ' alone' in the label.
-        """
-        pat = re.compile(rf"\bNot Hispanic or Latino\b.*\b{re.escape(race_phrase)}\s+alone\b", re.IGNORECASE)
-        for cid, lab in label_map.items():
-            if not cid.startswith("P4_"):
-                continue
-            if "Not Hispanic or Latino" not in lab:
-                continue
-            if pat.search(lab):
-                return cid
-        return None
-
-    # Step A-4: Locate the "alone" sub-group columns
-    NH_WHITE_ALONE_COL = nh_alone_col("White")
-    NH_BLACK_ALONE_COL = nh_alone_col("Black or African American")
-    NH_ASIAN_ALONE_COL = nh_alone_col("Asian")
+    # Step A-2: Build label map from first 2 rows (ID row + label row). Only
+    # those two lines are sniffed with the csv module; the data itself is
+    # parsed once, in Step A-4.
+    with open(vap_csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        col_ids = next(reader, [])
+        labels = next(reader, [])
+    label_map = {
+        cid.strip(): label.strip()
+        for cid, label in zip_longest(col_ids, labels, fillvalue="")
+        if cid.strip()
+    }
+
+    # Candidate labels: P4_* ids whose label mentions "Not Hispanic or Latino"
+    p4_labels = pd.Series(label_map, index=pd.Index(list(label_map), dtype=object), dtype=object)
+    p4_labels = p4_labels[
+        p4_labels.index.str.startswith("P4_")
+        & p4_labels.str.contains("Not Hispanic or Latino", regex=False)
+    ]
+
+    # Step A-3: Locate the "alone" sub-group columns, i.e. the P4_* ids whose
+    # label reads 'Not Hispanic or Latino: <race> alone' (combination /
+    # multi-race lines never say ' alone'). One precompiled pattern covers all
+    # three races in a single pass; the first matching column wins per race.
+    alone_pat = re.compile(
+        r"\bNot Hispanic or Latino\b.*\b(White|Black or African American|Asian)\s+alone\b",
+        re.IGNORECASE,
+    )
+    alone_cols = {}
+    for col_id, label in p4_labels.items():
+        m = alone_pat.search(label)
+        if m:
+            alone_cols.setdefault(m.group(1).lower(), col_id)
+
+    NH_WHITE_ALONE_COL = alone_cols.get("white")
+    NH_BLACK_ALONE_COL = alone_cols.get("black or african american")
+    NH_ASIAN_ALONE_COL = alone_cols.get("asian")
 
     if verbose:
         print("NH_WHITE_ALONE_COL:", NH_WHITE_ALONE_COL)
         print("NH_BLACK_ALONE_COL:", NH_BLACK_ALONE_COL)
         print("NH_ASIAN_ALONE_COL:", NH_ASIAN_ALONE_COL)
 
+    # Step A-4: Read only the columns used below (the P.L. 94-171 table is
+    # hundreds of columns wide), then build the 15-digit block GEOID. Only the
+    # text columns are forced to str; the counts are parsed straight to
+    # numbers by the C reader instead of one Python str per cell (anything
+    # unparseable stays object and is coerced in Step A-6).
+    wanted = {"GEO_ID", "NAME", *base_cols}
+    wanted.update(c for c in [NH_WHITE_ALONE_COL, NH_BLACK_ALONE_COL, NH_ASIAN_ALONE_COL] if c)
+    pop = pd.read_csv(
+        vap_csv_path,
+        skiprows=[1],
+        dtype={"GEO_ID": str, "NAME": str},
+        usecols=lambda c: c in wanted,
+    )
+
+    # GEO_ID is fixed-width ("1000000US" + 15-digit block GEOID), so the
+    # block GEOID is simply its last 15 characters (one slice, no
+    # replace/strip/zfill passes)
+    pop["GEOID_BLOCK"] = pop["GEO_ID"].str.slice(-15)
+
     # Step A-5: Keep only needed columns
     keep_cols = ["GEO_ID", "NAME", "GEOID_BLOCK"] + base_cols
     for c in [NH_WHITE_ALONE_COL, NH_BLACK_ALONE_COL, NH_ASIAN_ALONE_COL]:
@@ -294,10 +519,18 @@ def build_precinct_geojson_with_vap(
     for c in [NH_WHITE_ALONE_COL, NH_BLACK_ALONE_COL, NH_ASIAN_ALONE_COL]:
         if c and c in vap.columns:
             num_cols.append(c)
-    vap[num_cols] = vap[num_cols].apply(_to_int_series)
+    # Columns the CSV reader already parsed as integers only need the int32
+    # cast; the rest (holding junk such as "-" or "") are coerced together in
+    # one to_numeric call over their flattened values
+    int_cols = [c for c in num_cols if pd.api.types.is_integer_dtype(vap[c])]
+    other_cols = [c for c in num_cols if c not in int_cols]
+    if int_cols:
+        vap[int_cols] = vap[int_cols].astype(np.int32)
+    if other_cols:
+        vap[other_cols] = _to_int_frame(vap[other_cols])
 
     # Step A-7: Compute base demographic groups at block level
-    vap["LATINO_VAP"] = vap["P4_002N"] if "P4_002N" in vap.columns else 0
+    vap["LATINO_VAP"] = _col_or_zero(vap, "P4_002N")
     vap["NH_WHITE_ALONE_VAP"] = _col_or_zero(vap, NH_WHITE_ALONE_COL)
     vap["NH_BLACK_ALONE_VAP"] = _col_or_zero(vap, NH_BLACK_ALONE_COL)
     vap["NH_ASIAN_ALONE_VAP"] = _col_or_zero(vap, NH_ASIAN_ALONE_COL)
@@ -314,105 +547,160 @@ def build_precinct_geojson_with_vap(
     ]
     agg_cols = [c for c in agg_cols if c in vap.columns]
 
-    # Step A-9: Ensure GEOID uniqueness (dedupe by summing numeric cols)
-    if vap["GEOID_BLOCK"].duplicated().any():
+    # Step A-9: Ensure GEOID uniqueness (dedupe by summing numeric cols).
+    # Sorted factorize codes + bincount give the same rows as a sorted
+    # groupby(...).agg(sum / first) without the hash-groupby machinery.
+    if not vap["GEOID_BLOCK"].is_unique:
         first_cols = [c for c in ["GEO_ID", "NAME"] if c in vap.columns]
-        vap = (
-            vap.groupby("GEOID_BLOCK", as_index=False)
-            .agg({**{c: "sum" for c in agg_cols}, **{c: "first" for c in first_cols}})
-        )
+        codes, uniques = pd.factorize(vap["GEOID_BLOCK"], sort=True)
+        _, first_row = np.unique(codes, return_index=True)
+        dedup = {"GEOID_BLOCK": uniques}
+        for c in agg_cols:
+            dedup[c] = np.bincount(
+                codes,
+                weights=vap[c].to_numpy(dtype=np.float64),
+                minlength=len(uniques),
+            ).astype(np.int32)
+        for c in first_cols:
+            dedup[c] = vap[c].to_numpy()[first_row]
+        vap = pd.DataFrame(dedup)
+
+    # ── Step B: Load precincts ────────────────────────────────────────────
+    prec = gpd.read_file(precincts_geojson_path)
 
-    # ── Step B: Read block geometries ─────────────────────────────────────
-    blocks = gpd.read_file(blocks_shp_path)
+    # ── Step C: Read block geometries ─────────────────────────────────────
+    # Only the GEOID attribute is read (TIGER block layers carry ~15 others
+    # that are never used). Optionally let GDAL skip blocks entirely outside
+    # the precincts' extent (bounds of the precinct envelopes, reprojected to
+    # the block layer's CRS).
+    bbox = None
+    if clip_blocks_to_precincts:
+        blocks_crs = pyogrio.read_info(blocks_shp_path)["crs"]
+        bbox = tuple(prec.geometry.envelope.to_crs(blocks_crs).total_bounds)
+    blocks = gpd.read_file(blocks_shp_path, columns=[blocks_geoid_col], bbox=bbox)
     blocks["GEOID_BLOCK"] = blocks[blocks_geoid_col].astype(str).str.strip().str.zfill(15)
 
-    # ── Step C: Merge VAP -> blocks ───────────────────────────────────────
+    # ── Step D: Merge VAP -> blocks ───────────────────────────────────────
+    # vap's columns are already integer; the left merge only introduces NaN
+    # for blocks without a VAP row, so one bulk fillna + cast restores ints
     blocks2 = blocks.merge(vap[["GEOID_BLOCK"] + agg_cols], on="GEOID_BLOCK", how="left")
-    for c in agg_cols:
-        blocks2[c] = pd.to_numeric(blocks2[c], errors="coerce").fillna(0).astype(int)
+    blocks2[agg_cols] = blocks2[agg_cols].fillna(0).astype(np.int32)
 
     if verbose:
         print("Blocks in shapefile:", len(blocks2))
         print("Rows in VAP table:", len(vap))
         print("Blocks missing merged VAP rows:", int(blocks2["GEOID_BLOCK"].isna().sum()))
 
-    # ── Step D: Load precincts ────────────────────────────────────────────
-    prec = gpd.read_file(precincts_geojson_path)
-
     # ── Step E: Block -> Precinct assignment ──────────────────────────────
-    blocks_proj = blocks2.to_crs(target_crs)
-    prec_proj = prec.to_crs(target_crs)
-
-    # Step E-1: Attempt to clean geometries
-    blocks_proj["geometry"] = blocks_proj["geometry"].buffer(0)
-    prec_proj["geometry"] = prec_proj["geometry"].buffer(0)
-
-    # Step E-2: Points guaranteed inside each block polygon
-    blocks_pts = blocks_proj[["GEOID_BLOCK", "geometry"] + agg_cols].copy()
-    blocks_pts["geometry"] = blocks_pts.geometry.representative_point()
-
-    # Step E-3: Strict point-in-polygon join
-    joined = gpd.sjoin(
-        blocks_pts,
-        prec_proj[[precinct_id_col, "geometry"]],
-        how="left",
-        predicate="within",
-    )
-
-    # Step E-4: Eliminate double counting
-    joined = joined.sort_values(["GEOID_BLOCK", precinct_id_col]).drop_duplicates(subset=["GEOID_BLOCK"])
-
-    # Step E-5: Fallback for unmatched blocks
-    unmatched_idx = joined[joined[precinct_id_col].isna()].index
-
-    if len(unmatched_idx):
-        unmatched = joined.loc[unmatched_idx].drop(columns=["index_right"], errors="ignore")
-
-        nearest = gpd.sjoin_nearest(
-            unmatched.drop(columns=[precinct_id_col], errors="ignore"),
-            prec_proj[[precinct_id_col, "geometry"]],
-            how="left",
-            distance_col="__dist",
-        )
-
-        nearest = nearest[~nearest.index.duplicated(keep="first")]
-        nearest = nearest.reindex(unmatched_idx)
-        joined.loc[unmatched_idx, precinct_id_col] = nearest[precinct_id_col].to_numpy()
+    # Step E-1: Attempt to clean geometries (the projected, cleaned precincts
+    # are kept in a context for the RUCA / income stages). Block polygons are
+    # repaired in their source CRS; they are never reprojected themselves.
+    _make_valid(blocks2)
+    context = _precinct_context(prec, target_crs)
+    prec_proj = context.prec_proj
+
+    # Step E-2: Points guaranteed inside each block polygon, computed in the
+    # source CRS and then reprojected (one vertex per block instead of every
+    # polygon vertex). From here to the end of Step F the blocks are held as
+    # plain arrays (SoA): the point geometries, the GEOID column and one int32
+    # array per VAP column.
+    block_pts = gpd.GeoSeries(
+        shapely.point_on_surface(blocks2.geometry.values), crs=blocks2.crs
+    ).to_crs(target_crs).values
+    block_ids = blocks2["GEOID_BLOCK"]
+    vals = {c: blocks2[c].to_numpy(dtype=np.int32) for c in agg_cols}
+    n_blocks = len(block_pts)
+
+    # Step E-3: Strict point-in-polygon join — one bulk STRtree query returns
+    # every (block, precinct) pair where the block point lies within the precinct
+    blk_idx, prec_idx = prec_proj.sindex.query(block_pts, predicate="within")
+
+    # Step E-4: Eliminate double counting. A block point on a shared edge may
+    # hit several precincts; keep the lowest precinct id (same choice as a
+    # sort by [GEOID_BLOCK, precinct_id] + drop_duplicates) via integer ranks.
+    # code[b] is the rank of block b's precinct id; n_ids means "no precinct".
+    prec_ids = prec_proj[precinct_id_col].reset_index(drop=True)
+    id_rank, id_uniques = pd.factorize(prec_ids, sort=True)
+    n_ids = len(id_uniques)
+    id_rank = np.where(id_rank < 0, n_ids, id_rank)  # missing ids sort last
+
+    order = np.lexsort((id_rank[prec_idx], blk_idx))
+    blk_first, first = np.unique(blk_idx[order], return_index=True)
+
+    code = np.full(n_blocks, n_ids, dtype=np.int64)
+    code[blk_first] = id_rank[prec_idx[order][first]]
+
+    # Duplicate block GEOIDs (rare; repeated shapefile rows) collapse to one
+    # row: the one with the lowest precinct id, unmatched last
+    keep = np.ones(n_blocks, dtype=bool)
+    if not block_ids.is_unique:
+        blk_codes, _ = pd.factorize(block_ids)
+        dedup = np.lexsort((code, blk_codes))
+        _, first = np.unique(blk_codes[dedup], return_index=True)
+        keep[:] = False
+        keep[dedup[first]] = True
+
+    # Step E-5: Fallback for unmatched blocks (nearest precinct by distance)
+    unmatched = np.flatnonzero(keep & (code == n_ids))
+
+    if len(unmatched):
+        pos = _nearest_positions(prec_proj, block_pts[unmatched])
+        code[unmatched] = np.where(pos >= 0, id_rank[pos], n_ids)
 
     if verbose:
-        dup_blocks = int(joined["GEOID_BLOCK"].duplicated().sum())
-        unmatched_blocks = int(joined[precinct_id_col].isna().sum())
+        dup_blocks = int(block_ids[keep].duplicated().sum())
+        unmatched_blocks = int((keep & (code == n_ids)).sum())
         print("Duplicate blocks after join:", dup_blocks)
         print("Blocks not matched to any precinct:", unmatched_blocks)
 
     # ── Step F: Aggregate (sum) VAP per precinct ──────────────────────────
-    agg = (
-        joined.dropna(subset=[precinct_id_col])
-        .groupby(precinct_id_col)[agg_cols]
-        .sum()
-        .reset_index()
-    )
-
-    # Step F-1: Merge back to precincts
-    prec2 = prec.merge(agg, on=precinct_id_col, how="left")
-    for c in agg_cols:
-        prec2[c] = pd.to_numeric(prec2[c], errors="coerce").fillna(0).astype(int)
+    # bincount over the integer precinct-id codes: one contiguous O(N) pass
+    # per column instead of a string-keyed hash groupby. Slot n_ids ("no id")
+    # stays 0, as do precincts without blocks.
+    valid = keep & (code < n_ids)
+    sums = {
+        c: np.bincount(
+            code[valid],
+            weights=vals[c][valid].astype(np.float64),
+            minlength=n_ids + 1,
+        ).astype(np.int32)
+        for c in agg_cols
+    }
+
+    # Step F-1: Attach back to precincts by gathering on each precinct's id
+    # code (prec_proj rows follow prec's order), so no merge on the string id
+    prec2 = prec.reset_index(drop=True).assign(**{c: sums[c][id_rank] for c in agg_cols})
 
     if verbose:
         print("Precinct rows:", len(prec2))
         _print_vap_balance(prefix="", blocks_df=blocks2, prec_df=prec2)
 
-    # Step F-2: Standardize column names at precinct level
-    if "P4_001N" in prec2.columns:
-        prec2["VAP"] = prec2["P4_001N"]
+    # Step F-2: Derived precinct columns, gathered as integer arrays:
+    # standardized names for the P4 totals plus the state's feasible race
+    # collapse (Step F-3). They are attached in a single construction below.
+    def int_col(c):
+        if c in prec2.columns:
+            return _to_int_series(prec2[c]).to_numpy()
+        return np.zeros(len(prec2), dtype=np.int32)
+
+    derived = {"VAP": int_col("P4_001N" if "P4_001N" in prec2.columns else "VAP")}
     if "P4_002N" in prec2.columns:
-        prec2["HVAP"] = prec2["P4_002N"]
-        prec2["LATINO_VAP"] = prec2["P4_002N"]
+        derived["HVAP"] = derived["LATINO_VAP"] = int_col("P4_002N")
+    else:
+        derived["LATINO_VAP"] = int_col("LATINO_VAP")
     if "P4_003N" in prec2.columns:
-        prec2["NHVAP"] = prec2["P4_003N"]
+        derived["NHVAP"] = int_col("P4_003N")
+    derived["NH_WHITE_ALONE_VAP"] = int_col("NH_WHITE_ALONE_VAP")
+    derived["NH_BLACK_ALONE_VAP"] = int_col("NH_BLACK_ALONE_VAP")
 
     # Step F-3: Collapse to feasible race groups by state
-    prec2 = _apply_feasible_race_collapse(prec2, state_code=state_code)
+    derived["OTHER_VAP"] = _feasible_other_vap(
+        state_code,
+        derived["VAP"],
+        derived["LATINO_VAP"],
+        derived["NH_WHITE_ALONE_VAP"],
+        derived["NH_BLACK_ALONE_VAP"],
+    )
 
     # ── Step G: Create minimal precinct dataframe (preserve geometry) ─────
     keep_cols_out = [
@@ -435,21 +723,27 @@ def build_precinct_geojson_with_vap(
         "HH_MEDIAN_INC",
         "HH_MEAN_INC",
         "HH_TOTAL",
-
-        # geometry
-        "geometry",
     ]
-    keep_cols_out = [c for c in keep_cols_out if c in prec2.columns]
-    prec_clean = prec2[keep_cols_out].copy()
-
-    # Step G-1: Ensure ints for numeric fields
-    id_like = {"state", precinct_id_col, "official_boundary", "region_type", "geometry"}
-    for c in prec_clean.columns:
-        if c not in id_like:
-            prec_clean[c] = pd.to_numeric(prec_clean[c], errors="coerce").fillna(0).astype(int)
+    keep_cols_out = [c for c in keep_cols_out if c in derived or c in prec2.columns]
+
+    # Step G-1: Build the output in one go; identifiers are copied as-is,
+    # every other field is an integer (derived arrays already are; the
+    # remaining source columns are converted together in one block)
+    id_like = {"state", precinct_id_col, "official_boundary", "region_type"}
+    num_out = [c for c in keep_cols_out if c not in derived and c not in id_like]
+    num_block = _to_int_frame(prec2[num_out]) if num_out else None
+    out_cols = {}
+    for c in keep_cols_out:
+        if c in derived:
+            out_cols[c] = derived[c]
+        elif c in id_like:
+            out_cols[c] = prec2[c]
+        else:
+            out_cols[c] = num_block[:, num_out.index(c)]
+    prec_clean = gpd.GeoDataFrame(out_cols, index=prec2.index, geometry=prec2.geometry, crs=prec2.crs)
 
     if verbose:
-        print("Original columns:", len(prec2.columns))
+        print("Original columns:", len(prec2.columns.union(list(derived))))
         print("Cleaned columns:", len(prec_clean.columns))
         print("Cleaned column list:", list(prec_clean.columns))
 
@@ -468,7 +762,10 @@ def build_precinct_geojson_with_vap(
             )
 
     # Step G-2: Write output
-    prec_clean.to_file(output_geojson_path, driver="GeoJSON")
+    if output_geojson_path is not None:
+        prec_clean.to_file(output_geojson_path, driver="GeoJSON")
+    if return_context:
+        return prec_clean, context
     return prec_clean
 
 
@@ -482,53 +779,50 @@ def add_region_type_from_ruca(
     target_crs: str = "EPSG:5070",
     tract_geoid_col: str = "GEOID",
     ruca_tract_col: str = "TractFIPS20",
+    context: Optional[PrecinctContext] = None,
 ) -> gpd.GeoDataFrame:
     """
     Join USDA RUCA (Rural-Urban Commuting Area) codes onto precincts to assign
     a region_type label (urban / suburban / rural / unknown) to each precinct.
+    Pass the `context` returned by build_precinct_geojson_with_vap to reuse
+    its projected precincts and representative points.
     """
-    tracts = gpd.read_file(tracts_path)
     ruca = pd.read_csv(ruca_csv_path, dtype=str, encoding="latin1")
-
-    tracts["TRACT_ID"] = tracts[tract_geoid_col].astype(str).str.strip().str.zfill(11)
     ruca["TRACT_ID"] = ruca[ruca_tract_col].astype(str).str.strip().str.zfill(11)
 
     ruca_keep = ruca[["TRACT_ID", "PrimaryRUCA", "PrimaryRUCADescription"]].copy()
     ruca_keep["PrimaryRUCA"] = pd.to_numeric(ruca_keep["PrimaryRUCA"], errors="coerce")
 
-    tracts2 = tracts.merge(ruca_keep, on="TRACT_ID", how="left")
+    # Projected, repaired and indexed tract geometries come from the per-path cache
+    tracts = _load_tracts(tracts_path, target_crs, tract_geoid_col)
 
-    prec_proj = precincts_gdf.to_crs(target_crs).copy()
-    tracts_proj = tracts2.to_crs(target_crs).copy()
-    tracts_proj["geometry"] = tracts_proj["geometry"].buffer(0)
-    prec_proj["geometry"] = prec_proj["geometry"].buffer(0)
-
-    prec_pts = prec_proj[["geometry"]].copy()
-    prec_pts["geometry"] = prec_pts.geometry.representative_point()
-
-    joined = gpd.sjoin(
-        prec_pts,
-        tracts_proj[["TRACT_ID", "PrimaryRUCA", "PrimaryRUCADescription", "geometry"]],
-        how="left",
-        predicate="within",
-    )
+    context = _precinct_context(precincts_gdf, target_crs, context)
 
-    def ruca_to_region(x):
-        if pd.isna(x):
-            return None
-        x = float(x)
-        if 1 <= x <= 3:
-            return "urban"
-        if 4 <= x <= 6:
-            return "suburban"
-        if 7 <= x <= 10:
-            return "rural"
-        return "unknown"
+    # Point-in-tract by position on the cached tract index (shared with the
+    # income stage through the context); only TRACT_ID is looked up, the
+    # RUCA fields are then attached with a hash merge on TRACT_ID
+    pos = _tract_positions(context, tracts_path, tract_geoid_col)
+    tract_ids = tracts["TRACT_ID"].reset_index(drop=True).reindex(pos).to_numpy()
+    joined = pd.DataFrame({"TRACT_ID": tract_ids}).merge(ruca_keep, on="TRACT_ID", how="left")
 
     out = precincts_gdf.copy()
     out["PrimaryRUCA"] = joined["PrimaryRUCA"].values
     out["PrimaryRUCADescription"] = joined["PrimaryRUCADescription"].values
-    out["region_type"] = out["PrimaryRUCA"].apply(ruca_to_region)
+
+    # RUCA code -> region_type in one vectorized pass:
+    # 1-3 urban, 4-6 suburban, 7-10 rural, any other code unknown, missing None
+    ruca = pd.to_numeric(out["PrimaryRUCA"], errors="coerce").to_numpy(dtype=float)
+    region = np.select(
+        [
+            (ruca >= 1) & (ruca <= 3),
+            (ruca >= 4) & (ruca <= 6),
+            (ruca >= 7) & (ruca <= 10),
+        ],
+        ["urban", "suburban", "rural"],
+        default="unknown",
+    ).astype(object)
+    region[np.isnan(ruca)] = None
+    out["region_type"] = region
     return out
 
 
@@ -545,26 +839,20 @@ def add_income_from_acs_s1901(
     keep_moe: bool = True,
     use_nearest_fallback: bool = True,
     impute_missing_income: bool = True,
+    context: Optional[PrecinctContext] = None,
 ) -> gpd.GeoDataFrame:
     """
     Add tract-level ACS S1901 income fields onto precincts using a
     representative-point-in-tract join. Precincts whose joined income is
     missing/0 are optionally filled from the nearest tract with non-missing
-    income.
+    income. Pass the `context` returned by build_precinct_geojson_with_vap to
+    reuse its projected precincts and representative points.
     """
 
-    tracts = gpd.read_file(tracts_path).copy()
-    tracts["TRACT_ID"] = tracts[tract_geoid_col].astype(str).str.strip().str.zfill(11)
-
     inc_raw = pd.read_csv(income_csv_path, dtype=str, skiprows=[1])
 
-    inc_raw["TRACT_ID"] = (
-        inc_raw["GEO_ID"]
-        .astype(str)
-        .str.replace("1400000US", "", regex=False)
-        .str.strip()
-        .str.zfill(11)
-    )
+    # GEO_ID is fixed-width ("1400000US" + 11-digit tract GEOID)
+    inc_raw["TRACT_ID"] = inc_raw["GEO_ID"].str.slice(-11)
 
     cols = ["TRACT_ID", "S1901_C01_001E", "S1901_C01_012E"]
     if keep_mean:
@@ -575,20 +863,15 @@ def add_income_from_acs_s1901(
     inc = inc_raw[cols].copy()
 
     def to_num(series: pd.Series) -> pd.Series:
-        return (
-            pd.to_numeric(
-                series.astype(str).str.replace(",", "", regex=False).replace({"-": None, "": None}),
-                errors="coerce",
-            )
-            .fillna(0)
-        )
+        # "-", "" and other non-numeric cells coerce to NaN -> 0
+        return pd.to_numeric(series.str.replace(",", "", regex=False), errors="coerce").fillna(0)
 
     if "S1901_C01_001E" in inc.columns:
-        inc["S1901_C01_001E"] = to_num(inc["S1901_C01_001E"]).astype(int)
+        inc["S1901_C01_001E"] = to_num(inc["S1901_C01_001E"]).astype(np.int32)
 
     for c in ["S1901_C01_012E", "S1901_C01_013E", "S1901_C01_012M", "S1901_C01_013M"]:
         if c in inc.columns:
-            inc[c] = to_num(inc[c]).round(0).astype(int)
+            inc[c] = to_num(inc[c]).round(0).astype(np.int32)
 
     rename = {}
     if "S1901_C01_001E" in inc.columns:
@@ -603,18 +886,14 @@ def add_income_from_acs_s1901(
         rename["S1901_C01_013M"] = "HH_MEAN_INC_MOE"
     inc = inc.rename(columns=rename)
 
-    tracts2 = tracts.merge(inc, on="TRACT_ID", how="left")
-    for c in ["HH_TOTAL", "HH_MEDIAN_INC", "HH_MEAN_INC", "HH_MEDIAN_INC_MOE", "HH_MEAN_INC_MOE"]:
-        if c in tracts2.columns:
-            tracts2[c] = pd.to_numeric(tracts2[c], errors="coerce").fillna(0).astype(int)
-
-    prec_proj = precincts_gdf.to_crs(target_crs).copy()
-    tracts_proj = tracts2.to_crs(target_crs).copy()
-    prec_proj["geometry"] = prec_proj["geometry"].buffer(0)
-    tracts_proj["geometry"] = tracts_proj["geometry"].buffer(0)
+    # Projected, repaired and indexed tract geometries come from the per-path cache
+    tracts = _load_tracts(tracts_path, target_crs, tract_geoid_col)
+    tracts_proj = tracts.merge(inc, on="TRACT_ID", how="left")
+    inc_cols = [c for c in ["HH_TOTAL", "HH_MEDIAN_INC", "HH_MEAN_INC", "HH_MEDIAN_INC_MOE", "HH_MEAN_INC_MOE"]
+                if c in tracts_proj.columns]
+    tracts_proj[inc_cols] = tracts_proj[inc_cols].fillna(0).astype(np.int32)
 
-    prec_pts = prec_proj[["geometry"]].copy()
-    prec_pts["geometry"] = prec_pts.geometry.representative_point()
+    context = _precinct_context(precincts_gdf, target_crs, context)
 
     attrs = [c for c in [
         "TRACT_ID",
@@ -622,39 +901,28 @@ def add_income_from_acs_s1901(
         "HH_MEDIAN_INC_MOE", "HH_MEAN_INC_MOE"
     ] if c in tracts_proj.columns]
 
-    joined = gpd.sjoin(
-        prec_pts,
-        tracts_proj[attrs + ["geometry"]],
-        how="left",
-        predicate="within",
-    )
+    # Point-in-tract positions (computed once per context and tract file,
+    # usually already by the RUCA stage) plus the nearest fallback; only
+    # TRACT_ID is looked up, the income fields are attached afterwards with a
+    # hash merge on TRACT_ID
+    rep_pts = context.rep_pts.values
+    pos = _tract_positions(context, tracts_path, tract_geoid_col).copy()
 
     if use_nearest_fallback:
-        unmatched_idx = joined[joined["TRACT_ID"].isna()].index
-        if len(unmatched_idx):
-            unmatched = joined.loc[unmatched_idx].drop(columns=["index_right"], errors="ignore")
-            nearest = gpd.sjoin_nearest(
-                unmatched.drop(columns=["TRACT_ID"], errors="ignore"),
-                tracts_proj[attrs + ["geometry"]],
-                how="left",
-                distance_col="__dist",
-            )
-            nearest = nearest[~nearest.index.duplicated(keep="first")].reindex(unmatched_idx)
-            for c in attrs:
-                if c in nearest.columns:
-                    joined.loc[unmatched_idx, c] = nearest[c].values
+        unmatched = np.flatnonzero(pos < 0)
+        if len(unmatched):
+            # One bulk nearest query on the tract index (-1 -> missing)
+            pos[unmatched] = _nearest_positions(tracts, rep_pts[unmatched])
+
+    tract_ids = tracts["TRACT_ID"].reset_index(drop=True).reindex(pos).to_numpy()
+    joined = pd.DataFrame({"TRACT_ID": tract_ids}).merge(tracts_proj[attrs], on="TRACT_ID", how="left")
 
     out = precincts_gdf.copy()
-    for c in ["HH_TOTAL", "HH_MEDIAN_INC", "HH_MEAN_INC", "HH_MEDIAN_INC_MOE", "HH_MEAN_INC_MOE"]:
-        if c in joined.columns:
-            out[c] = pd.to_numeric(joined[c], errors="coerce").fillna(0).astype(int)
+    out[inc_cols] = joined[inc_cols].fillna(0).astype(np.int32).to_numpy()
 
     out["INCOME_IMPUTED"] = False
 
     if impute_missing_income and ("HH_MEDIAN_INC" in out.columns or "HH_MEAN_INC" in out.columns):
-        prec_pts2 = prec_proj[["geometry"]].copy()
-        prec_pts2["geometry"] = prec_pts2.geometry.representative_point()
-
         has_mean = "HH_MEAN_INC" in out.columns
         has_median = "HH_MEDIAN_INC" in out.columns
 
@@ -667,36 +935,33 @@ def add_income_from_acs_s1901(
 
         missing_idx = out.index[missing_mask]
         if len(missing_idx):
-            tracts_good = tracts_proj.copy()
-            good_mask = pd.Series(False, index=tracts_good.index)
-            if "HH_MEAN_INC" in tracts_good.columns:
-                good_mask = good_mask | (tracts_good["HH_MEAN_INC"] > 0)
-            if "HH_MEDIAN_INC" in tracts_good.columns:
-                good_mask = good_mask | (tracts_good["HH_MEDIAN_INC"] > 0)
-            tracts_good = tracts_good.loc[good_mask]
+            good_mask = pd.Series(False, index=tracts_proj.index)
+            if "HH_MEAN_INC" in tracts_proj.columns:
+                good_mask = good_mask | (tracts_proj["HH_MEAN_INC"] > 0)
+            if "HH_MEDIAN_INC" in tracts_proj.columns:
+                good_mask = good_mask | (tracts_proj["HH_MEDIAN_INC"] > 0)
+            tracts_good = tracts_proj.loc[good_mask]
 
             if len(tracts_good):
-                miss_pts = prec_pts2.loc[missing_idx].copy()
-                nearest_good = gpd.sjoin_nearest(
-                    miss_pts,
-                    tracts_good[attrs + ["geometry"]],
-                    how="left",
-                    distance_col="__dist",
-                )
-                nearest_good = nearest_good[~nearest_good.index.duplicated(keep="first")].reindex(missing_idx)
+                # Nearest tract with income for every missing precinct in one
+                # STRtree query (point-to-polygon distance, as before)
+                miss_geoms = context.rep_pts.loc[missing_idx].values
+                pos = _nearest_positions(tracts_good, miss_geoms)
+                nearest_good = tracts_good[attrs].reset_index(drop=True).reindex(pos)
 
                 for c in ["HH_TOTAL", "HH_MEDIAN_INC", "HH_MEAN_INC", "HH_MEDIAN_INC_MOE", "HH_MEAN_INC_MOE"]:
                     if c in out.columns and c in nearest_good.columns:
-                        out.loc[missing_idx, c] = pd.to_numeric(nearest_good[c], errors="coerce").fillna(0).astype(int).values
+                        out.loc[missing_idx, c] = pd.to_numeric(nearest_good[c], errors="coerce").fillna(0).astype(np.int32).values
 
                 out.loc[missing_idx, "INCOME_IMPUTED"] = True
 
     if "HH_MEAN_INC" in out.columns and "HH_MEDIAN_INC" in out.columns:
-        out["AVG_HH_INC"] = out["HH_MEAN_INC"].where(out["HH_MEAN_INC"] > 0, out["HH_MEDIAN_INC"]).astype(int)
+        mean = out["HH_MEAN_INC"].to_numpy()
+        out["AVG_HH_INC"] = np.where(mean > 0, mean, out["HH_MEDIAN_INC"].to_numpy()).astype(np.int32)
     elif "HH_MEAN_INC" in out.columns:
-        out["AVG_HH_INC"] = out["HH_MEAN_INC"].astype(int)
+        out["AVG_HH_INC"] = out["HH_MEAN_INC"].astype(np.int32)
     elif "HH_MEDIAN_INC" in out.columns:
-        out["AVG_HH_INC"] = out["HH_MEDIAN_INC"].astype(int)
+        out["AVG_HH_INC"] = out["HH_MEDIAN_INC"].astype(np.int32)
 
     if "HH_MEAN_INC" in out.columns and "HH_MEDIAN_INC" in out.columns:
         out["INCOME_MISSING"] = (out["HH_MEAN_INC"] == 0) & (out["HH_MEDIAN_INC"] == 0)
@@ -710,6 +975,64 @@ def add_income_from_acs_s1901(
     return out
 
 
+# ── Stage cache ───────────────────────────────────────────────────────────
+
+def _input_stamp(paths) -> dict:
+    """
+    {path: mtime} for the given input files. A shapefile path also covers
+    its .dbf/.shx/.prj sidecars, which hold the attributes and CRS.
+    """
+    stamp = {}
+    for path in paths:
+        stem, ext = os.path.splitext(path)
+        group = [stem + e for e in (".shp", ".dbf", ".shx", ".prj")] if ext.lower() == ".shp" else [path]
+        for f in group:
+            if os.path.exists(f):
+                stamp[f] = os.path.getmtime(f)
+    return stamp
+
+
+def _cached_stage(cache_path: Optional[str], inputs, build, *args, **kwargs):
+    """
+    Run one pipeline stage, reusing a pickled snapshot of its result.
+
+    The snapshot stores the GeoDataFrame together with the modification
+    times of `inputs`. It is reused only when those times still match;
+    otherwise `build(*args, **kwargs)` runs and the snapshot is rewritten.
+    With `cache_path` None the stage simply runs (no snapshot).
+
+    Parameters
+    ----------
+    cache_path : str or None  Snapshot path (pickle).
+    inputs     : list[str]    Files the stage reads, including the previous
+                              stage's snapshot so a rebuilt stage
+                              invalidates the ones after it.
+    build      : callable     Stage function (e.g. add_region_type_from_ruca).
+    *args, **kwargs           Passed through to `build`.
+
+    Returns
+    -------
+    Whatever `build` returns. A stage called with return_context=True gets
+    (gdf, None) on a cache hit; the next stage then rebuilds the context.
+    """
+    if cache_path is None:
+        return build(*args, **kwargs)
+
+    stamp = _input_stamp(inputs)
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            snapshot = pickle.load(f)
+        if snapshot["inputs"] == stamp:
+            gdf = snapshot["gdf"]
+            return (gdf, None) if kwargs.get("return_context") else gdf
+
+    result = build(*args, **kwargs)
+    gdf = result[0] if isinstance(result, tuple) else result
+    with open(cache_path, "wb") as f:
+        pickle.dump({"inputs": stamp, "gdf": gdf}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return result
+
+
 # ── QA helpers ────────────────────────────────────────────────────────────
 
 def qa(df: gpd.GeoDataFrame, name: str):
@@ -719,22 +1042,26 @@ def qa(df: gpd.GeoDataFrame, name: str):
     print("\n==", name, "==")
     print("rows:", len(df))
 
-    for c in ["VAP", "WHITE_VAP", "BLACK_VAP", "LATINO_VAP", "OTHER_VAP"]:
-        if c in df.columns:
-            print(c, "sum:", int(df[c].sum()))
+    # One reduction over all present columns; the checks below reuse it
+    # (the sum of a row-wise sum equals the sum of the column sums)
+    present = [c for c in ["VAP", "WHITE_VAP", "BLACK_VAP", "LATINO_VAP", "OTHER_VAP"] if c in df.columns]
+    sums = {c: int(v) for c, v in df[present].sum().items()}
+
+    for c in present:
+        print(c, "sum:", sums[c])
 
-    if all(c in df.columns for c in ["VAP", "WHITE_VAP", "BLACK_VAP", "OTHER_VAP"]):
+    if all(c in sums for c in ["VAP", "WHITE_VAP", "BLACK_VAP", "OTHER_VAP"]):
         print(
             "Check VAP == WHITE + BLACK + OTHER (sum):",
-            int(df["VAP"].sum()),
-            int((df["WHITE_VAP"] + df["BLACK_VAP"] + df["OTHER_VAP"]).sum()),
+            sums["VAP"],
+            sums["WHITE_VAP"] + sums["BLACK_VAP"] + sums["OTHER_VAP"],
         )
 
-    if all(c in df.columns for c in ["VAP", "LATINO_VAP", "WHITE_VAP", "OTHER_VAP"]):
+    if all(c in sums for c in ["VAP", "LATINO_VAP", "WHITE_VAP", "OTHER_VAP"]):
         print(
             "Check VAP == LATINO + WHITE + OTHER (sum):",
-            int(df["VAP"].sum()),
-            int((df["LATINO_VAP"] + df["WHITE_VAP"] + df["OTHER_VAP"]).sum()),
+            sums["VAP"],
+            sums["LATINO_VAP"] + sums["WHITE_VAP"] + sums["OTHER_VAP"],
         )
 
     if "VAP" in df.columns:
@@ -759,69 +1086,123 @@ def qa_income(df: gpd.GeoDataFrame, name: str):
     Print income QA for a precinct GeoDataFrame.
     """
     print("\n==", name, "income QA ==")
-    for c in ["AVG_HH_INC", "HH_MEDIAN_INC", "HH_MEAN_INC", "HH_TOTAL"]:
-        if c in df.columns:
+    present = [c for c in ["AVG_HH_INC", "HH_MEDIAN_INC", "HH_MEAN_INC", "HH_TOTAL"] if c in df.columns]
+    if present:
+        # min / max / nonzero count for every column from one 2-D array
+        vals = df[present].to_numpy()
+        mins, maxs = vals.min(axis=0), vals.max(axis=0)
+        nonzero = (vals > 0).sum(axis=0)
+        for k, c in enumerate(present):
             print(
                 c,
                 "min/max/sum_nonzero:",
-                int(df[c].min()),
-                int(df[c].max()),
-                int((df[c] > 0).sum()),
+                int(mins[k]),
+                int(maxs[k]),
+                int(nonzero[k]),
             )
     if "AVG_HH_INC" in df.columns:
         print("Missing AVG_HH_INC:", int((df["AVG_HH_INC"] == 0).sum()))
 
 
-# ── Script entry ──────────────────────────────────────────────────────────
-if __name__ == "__main__":
-    # Step 0: Build enriched precinct GeoJSONs with collapsed feasible-race VAP
-    AL = build_precinct_geojson_with_vap(
-        vap_csv_path="BASE_FILES/AL-VAP-population.csv",
-        blocks_shp_path="BASE_FILES/AL-shapefile/tl_2025_01_tabblock20.shp",
-        precincts_geojson_path="AL_data/AL-precincts-with-results-enacted.geojson",
-        output_geojson_path="AL_data/AL_precincts_full.geojson",
-        state_code="AL",
-        verbose=True,
-    )
+# ── Per-state pipeline ────────────────────────────────────────────────────
+
+STATE_INPUTS = {
+    "AL": {
+        "vap_csv_path": "BASE_FILES/AL-VAP-population.csv",
+        "blocks_shp_path": "BASE_FILES/AL-shapefile/tl_2025_01_tabblock20.shp",
+        "precincts_path": "AL_data/AL-precincts-with-results-enacted.fgb",
+        "ruca_csv_path": "BASE_FILES/region-type.csv",
+        "tracts_path": "BASE_FILES/AL_tract/tl_2025_01_tract.shp",
+        "income_csv_path": "BASE_FILES/AL-income.csv",
+        "data_dir": "AL_data",
+    },
+    "OR": {
+        "vap_csv_path": "BASE_FILES/OR-VAP-population.csv",
+        "blocks_shp_path": "BASE_FILES/OR-shapefile/tl_2025_41_tabblock20.shp",
+        "precincts_path": "OR_data/OR-precincts-with-results-enacted.fgb",
+        "ruca_csv_path": "BASE_FILES/region-type.csv",
+        "tracts_path": "BASE_FILES/OR_tract/tl_2025_41_tract.shp",
+        "income_csv_path": "BASE_FILES/OR-income.csv",
+        "data_dir": "OR_data",
+    },
+}
+
+
+def run_state(state_code: str, cache_dir: Optional[str] = None) -> gpd.GeoDataFrame:
+    """
+    Run the VAP -> RUCA -> income stages for one state and write its final
+    precinct GeoJSON. When `cache_dir` is given, each stage is snapshotted
+    there (<cache_dir>/<ST>_stage*.pkl) and a re-run reuses a snapshot as long
+    as the stage's input files are unchanged. States share no state, so they
+    can run in separate processes.
 
-    OR = build_precinct_geojson_with_vap(
-        vap_csv_path="BASE_FILES/OR-VAP-population.csv",
-        blocks_shp_path="BASE_FILES/OR-shapefile/tl_2025_41_tabblock20.shp",
-        precincts_geojson_path="OR_data/OR-precincts-with-results-enacted.geojson",
-        output_geojson_path="OR_data/OR_precincts_full.geojson",
-        state_code="OR",
+    Parameters
+    ----------
+    state_code : str          Key into STATE_INPUTS ("AL" or "OR").
+    cache_dir  : str or None  Directory for the stage snapshots; None (the
+                              default) runs every stage without snapshots.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        The fully enriched precinct GeoDataFrame.
+    """
+    cfg = STATE_INPUTS[state_code]
+    prefix = f"{cfg['data_dir']}/{state_code}"
+
+    def snapshot(name):
+        return None if cache_dir is None else os.path.join(cache_dir, f"{state_code}_{name}.pkl")
+
+    stage1, stage2, stage3 = snapshot("stage1_vap"), snapshot("stage2_ruca"), snapshot("stage3_income")
+
+    # Step 0: Build enriched precincts with collapsed feasible-race VAP
+    prec, ctx = _cached_stage(
+        stage1,
+        [cfg["vap_csv_path"], cfg["blocks_shp_path"], cfg["precincts_path"]],
+        build_precinct_geojson_with_vap,
+        vap_csv_path=cfg["vap_csv_path"],
+        blocks_shp_path=cfg["blocks_shp_path"],
+        precincts_geojson_path=cfg["precincts_path"],
+        output_geojson_path=None,  # final file is written in Step 3
+        state_code=state_code,
         verbose=True,
+        return_context=True,
     )
 
-    # Step 1: Add RUCA region_type for AL and OR
-    AL2 = add_region_type_from_ruca(
-        AL,
-        tracts_path="BASE_FILES/AL_tract/tl_2025_01_tract.shp",
-        ruca_csv_path="BASE_FILES/region-type.csv",
-    )
-    OR2 = add_region_type_from_ruca(
-        OR,
-        tracts_path="BASE_FILES/OR_tract/tl_2025_41_tract.shp",
-        ruca_csv_path="BASE_FILES/region-type.csv",
+    # Step 1: Add RUCA region_type
+    prec2 = _cached_stage(
+        stage2,
+        [stage1, cfg["tracts_path"], cfg["ruca_csv_path"]],
+        add_region_type_from_ruca,
+        prec,
+        tracts_path=cfg["tracts_path"],
+        ruca_csv_path=cfg["ruca_csv_path"],
+        context=ctx,
     )
 
-    # Step 2: Add ACS S1901 income fields for AL and OR
-    AL3 = add_income_from_acs_s1901(
-        AL2,
-        tracts_path="BASE_FILES/AL_tract/tl_2025_01_tract.shp",
-        income_csv_path="BASE_FILES/AL-income.csv",
-        use_nearest_fallback=True,
-    )
-    OR3 = add_income_from_acs_s1901(
-        OR2,
-        tracts_path="BASE_FILES/OR_tract/tl_2025_41_tract.shp",
-        income_csv_path="BASE_FILES/OR-income.csv",
+    # Step 2: Add ACS S1901 income fields
+    prec3 = _cached_stage(
+        stage3,
+        [stage2, cfg["tracts_path"], cfg["income_csv_path"]],
+        add_income_from_acs_s1901,
+        prec2,
+        tracts_path=cfg["tracts_path"],
+        income_csv_path=cfg["income_csv_path"],
         use_nearest_fallback=True,
+        context=ctx,
     )
 
-    # Step 3: Write final GeoJSONs
-    AL3.to_file("AL_data/AL_precincts_full.geojson", driver="GeoJSON")
-    OR3.to_file("OR_data/OR_precincts_full.geojson", driver="GeoJSON")
+    # Step 3: Write final GeoJSON
+    prec3.to_file(f"{prefix}_precincts_full.geojson", driver="GeoJSON")
+    return prec3
+
+
+# ── Script entry ──────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    # Steps 0-3: AL and OR are independent, so each runs in its own process
+    # (GEOS work and file IO overlap; threads would serialize on the GIL)
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        AL3, OR3 = ex.map(run_state, ["AL", "OR"])
 
     # Step 4: Run QA checks
     qa(AL3, "AL")
@@ -833,19 +1214,21 @@ if __name__ == "__main__":
     qa_income(AL3, "AL3")
     qa_income(OR3, "OR3")
 
-    # Step 5: Crude ballpark check on median income
+    # Step 5: Crude ballpark check on median income (median over the nonzero
+    # values, masked directly on the numpy array)
     if "HH_MEDIAN_INC" in AL3.columns:
-        print(AL3["HH_MEDIAN_INC"].replace(0, pd.NA).dropna().median())
+        v = AL3["HH_MEDIAN_INC"].to_numpy()
+        print(np.median(v[v != 0]))
     if "HH_MEDIAN_INC" in OR3.columns:
-        print(OR3["HH_MEDIAN_INC"].replace(0, pd.NA).dropna().median())
+        v = OR3["HH_MEDIAN_INC"].to_numpy()
+        print(np.median(v[v != 0]))
 
-    # Step 6: Report missing income rows
+    # Step 6: Report missing income rows (counted from the boolean flag; no
+    # filtered GeoDataFrame is built)
     if "HH_MEDIAN_INC" in AL3.columns and "GEOID" in AL3.columns:
-        missing_al = AL3[AL3["INCOME_MISSING"]][["GEOID", "geometry"]]
-        print("missing AL precincts:", len(missing_al))
+        print("missing AL precincts:", int(AL3["INCOME_MISSING"].to_numpy().sum()))
     if "HH_MEDIAN_INC" in OR3.columns and "GEOID" in OR3.columns:
-        missing_or = OR3[OR3["INCOME_MISSING"]][["GEOID", "geometry"]]
-        print("missing OR precincts:", len(missing_or))
+        print("missing OR precincts:", int(OR3["INCOME_MISSING"].to_numpy().sum()))
 
     print("AL imputed:", int(AL3["INCOME_IMPUTED"].sum()), "still missing:", int(AL3["INCOME_MISSING"].sum()))
     print("OR imputed:", int(OR3["INCOME_IMPUTED"].sum()), "still missing:", int(OR3["INCOME_MISSING"].sum()))
\ No newline at end of file
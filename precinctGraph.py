@@ -16,17 +16,29 @@ Adjacency criteria (in order of precedence)
    `connect_components_to_largest` adds one bridge edge per component (based
    on nearest centroid distance) to guarantee full graph connectivity.
 
-Module-level script section builds graphs for Alabama (AL) and Oregon (OR).
+The `__main__` section (bottom of file) builds the Alabama (AL) and Oregon
+(OR) graphs in parallel processes.
 
-Dependencies: pandas, geopandas, networkx, json, numpy
+Dependencies: pandas, geopandas, pyogrio, networkx, json, numpy, scipy, shapely>=2.0
 """
 
 import pandas as pd
 import geopandas as gpd
 import networkx as nx
 from networkx.readwrite import json_graph
+import gzip
 import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
+import shapely
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+from typing import Optional
+
+# Vectorized (whole-layer) reads/writes instead of per-feature fiona callbacks
+gpd.options.io_engine = "pyogrio"
 
 # Conversion factor: US survey feet to meters
 FEET_TO_METERS = 0.3048
@@ -70,30 +82,131 @@ def sanitize_for_json(x):
     return x
 
 
-def sanitize_obj(obj):
+def _json_default(obj):
+    """
+    `default=` hook for json.dumps: called by the encoder only for values it
+    cannot serialize natively (numpy scalars, pandas NA), which are converted
+    with `sanitize_for_json`.
+
+    Raises
+    ------
+    TypeError
+        If the value has no JSON-safe equivalent.
+    """
+    value = sanitize_for_json(obj)
+    if value is obj:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return value
+
+
+# ── Vectorized GEOS helpers ────────────────────────────────────────────────
+
+def _overlap_length(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     """
-    Recursively sanitize a nested dict/list structure for JSON serialization
-    by applying `sanitize_for_json` to every leaf value.
+    Length of the pairwise intersection of two equal-length geometry arrays.
+    """
+    return shapely.length(shapely.intersection(a, b))
+
+
+def _threaded(
+    func,
+    *arrays: np.ndarray,
+    min_chunk: int = 2048,
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Apply a vectorized, element-wise shapely function to equal-length
+    geometry arrays in contiguous chunks on a thread pool.
+
+    Shapely 2 releases the GIL inside GEOS calls, so the chunks run on
+    separate cores; results are concatenated back in input order. Small
+    inputs (or a single worker) run in the calling thread.
+
+    Thread safety: a prepared geometry builds its GEOS index lazily on the
+    first predicate call, so predicate functions (intersects, contains,
+    within, touches, covers, ...) must not be run here on prepared inputs.
+    Constructive and measurement functions (buffer, boundary, intersection,
+    length, distance) never consult the prepared index and are safe on
+    prepared or unprepared geometries alike.
 
     Parameters
     ----------
-    obj : dict | list | any
-        The object to sanitize.
+    func        : callable  Element-wise function of the arrays (e.g. shapely.distance).
+    *arrays     : np.ndarray Geometry arrays of equal length.
+    min_chunk   : int       Minimum number of elements per chunk.
+    max_workers : int|None  Cap on the thread count (default: os.cpu_count()).
 
     Returns
     -------
-    dict | list | JSON-safe scalar
-        Sanitized copy of the input.
+    np.ndarray
+        func(*arrays), computed chunk by chunk.
     """
-    if isinstance(obj, dict):
-        return {k: sanitize_obj(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [sanitize_obj(v) for v in obj]
-    return sanitize_for_json(obj)
+    n = len(arrays[0])
+    workers = min(max_workers or os.cpu_count() or 1, n // min_chunk)
+    if workers <= 1:
+        return func(*arrays)
+    cuts = np.linspace(0, n, workers + 1, dtype=int)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(
+            lambda k: func(*(a[cuts[k]:cuts[k + 1]] for a in arrays)),
+            range(workers),
+        )
+        return np.concatenate(list(parts))
 
 
 # ── Graph connectivity helper ─────────────────────────────────────────────
 
+def _components_by_size(G: nx.Graph) -> list:
+    """
+    Connected components of G as node sets, largest first (ties keep
+    discovery order, like sorting nx.connected_components by size).
+
+    Labels come from scipy's compiled connected_components on the sparse
+    adjacency matrix instead of networkx's Python-level BFS.
+
+    Returns
+    -------
+    list[set]
+        Components sorted by size, descending; empty for an empty graph.
+    """
+    nodes = list(G)
+    if not nodes:
+        return []
+    adj = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format="csr")
+    n_comp, labels = connected_components(adj, directed=False)
+    sizes = np.bincount(labels, minlength=n_comp)
+    groups = np.split(
+        np.asarray(nodes, dtype=object)[np.argsort(labels, kind="stable")],
+        np.cumsum(sizes)[:-1],
+    )
+    return [set(groups[k]) for k in np.argsort(-sizes, kind="stable")]
+
+
+def _centroid_coords(gdf_proj: gpd.GeoDataFrame, id_col: str):
+    """
+    Representative-point coordinates of every precinct as one (n, 2) array,
+    with the node ids and an id -> row position lookup.
+
+    Returns
+    -------
+    (np.ndarray, list, dict)
+        xy coordinates, ids in row order, and {id: row position}.
+    """
+    xy = shapely.get_coordinates(shapely.point_on_surface(np.asarray(gdf_proj.geometry.values)))
+    ids = gdf_proj[id_col].tolist()
+    return xy, ids, {gid: i for i, gid in enumerate(ids)}
+
+
+def _pair_distances(xy: np.ndarray, a_idx, b_idx) -> np.ndarray:
+    """
+    Euclidean distance matrix between rows `a_idx` and rows `b_idx` of `xy`,
+    computed in one numpy broadcast.
+    """
+    dx = xy[a_idx, 0][:, None] - xy[b_idx, 0][None, :]
+    dy = xy[a_idx, 1][:, None] - xy[b_idx, 1][None, :]
+    return np.sqrt(dx * dx + dy * dy)
+
+
 def connect_components_to_largest(G: nx.Graph, gdf_proj: gpd.GeoDataFrame, id_col: str = "GEOID"):
     """
     Connect each non-largest connected component to the largest component by
@@ -110,50 +223,60 @@ def connect_components_to_largest(G: nx.Graph, gdf_proj: gpd.GeoDataFrame, id_co
                                   `id_col` as a column.
     id_col   : str               Column name of the node identifier in gdf_proj.
     """
-    comps = list(nx.connected_components(G))
-    if len(comps) <= 1:
+    # Step 0: Components sorted by size descending
+    comps_sorted = _components_by_size(G)
+    if len(comps_sorted) <= 1:
         return
 
-    # Step 0: Sort components by size descending
-    comps_sorted = sorted(comps, key=len, reverse=True)
     largest = comps_sorted[0]
     others = comps_sorted[1:]
 
-    # Step 1: Precompute representative-point centroids in the metric CRS
-    centroids = gdf_proj.set_index(id_col).geometry.representative_point()
+    # Step 1: Precompute representative-point centroids in the metric CRS as
+    # one (x, y) coordinate array, plus a node id -> row position lookup
+    xy, ids, pos = _centroid_coords(gdf_proj, id_col)
 
-    largest_list = list(largest)
+    largest_idx = [pos[b] for b in largest if b in pos]
+
+    # Step 1a: One KD-tree over the largest component's centroids, built once.
+    # Bridge endpoints joined later are few (one per component), so they are
+    # kept in a short side list and checked by brute force instead of
+    # rebuilding the tree after every bridge.
+    tree = cKDTree(xy[largest_idx])
+    joined_idx = []
 
     added = 0
     for comp in others:
-        comp_list = list(comp)
-
-        # Step 2: Compute nearest centroid pair between this component and
-        # the largest component (O(|comp|*|largest|) but fine for a few comps)
-        best = None  # (dist, a, b)
-        for a in comp_list:
-            if a not in centroids.index:
-                continue
-            ca = centroids.loc[a]
-            # distance from a to all nodes in largest
-            dists = centroids.loc[largest_list].distance(ca)
-            b = str(dists.idxmin())
-            dist = float(dists.min())
-            if best is None or dist < best[0]:
-                best = (dist, str(a), b)
-
-        if best is None:
+        comp_idx = [pos[a] for a in comp if a in pos]
+        if not comp_idx:
             continue
 
-        # Step 3: Add bridge edge
-        dist_m, a, b = best
+        # Step 2: Nearest centroid pair between this component and the largest
+        # component — one tree query per component point, then the closest
+        # of the previously joined endpoints if any is strictly nearer
+        d, j = tree.query(xy[comp_idx])
+        target = np.asarray(largest_idx)[j]
+        if joined_idx:
+            extra = _pair_distances(xy, comp_idx, joined_idx)
+            k = np.argmin(extra, axis=1)
+            d_extra = extra[np.arange(len(comp_idx)), k]
+            closer = d_extra < d
+            d = np.where(closer, d_extra, d)
+            target = np.where(closer, np.asarray(joined_idx)[k], target)
+        ia = int(np.argmin(d))
+
+        # Step 3: Add bridge edge (distance re-measured the same way as the
+        # diagnostics, so the stored value does not depend on the tree)
+        a_row, b_row = comp_idx[ia], int(target[ia])
+        dist_m = float(_pair_distances(xy, [a_row], [b_row])[0, 0])
+        a = str(ids[a_row])
+        b = str(ids[b_row])
         G.add_edge(a, b, bridge=1, centroid_dist_m=dist_m)
         added += 1
 
         # Step 4: Update largest set so future comps connect to the now-expanded
         # giant component
         largest.add(a)
-        largest_list.append(a)
+        joined_idx.append(a_row)
 
     print("Bridge edges added to connect components:", added)
 
@@ -168,14 +291,20 @@ def build_precinct_adjacency_graph(
     precinct_id_col: str = "GEOID",
     target_crs: str = "EPSG:5070",
     min_shared_boundary_feet: float = 200.0,
+    proximity_feet: Optional[float] = 200.0,
+    out_graph_pickle: Optional[str] = None,
+    emit_json: bool = True,
+    max_threads: Optional[int] = None,
     verbose: bool = True,
 ):
     """
     Build a precinct adjacency graph from a precinct GeoJSON and write it to
-    two JSON output files (data directory + seawulf input directory).
+    two JSON output files (data directory + seawulf input directory), and
+    optionally to a gzipped pickle of the nx.Graph.
 
     Adjacency is determined by shared boundary length >= 200 ft OR polygon
-    proximity within 200 ft (tolerance adjacency). Remaining disconnected
+    proximity within `proximity_feet` (tolerance adjacency; skipped entirely
+    when `proximity_feet` is None). Remaining disconnected
     components are connected via nearest-centroid bridge edges.
 
     Parameters
@@ -187,6 +316,18 @@ def build_precinct_adjacency_graph(
     target_crs                : str    EPSG code for the projected CRS.
     min_shared_boundary_feet  : float  Minimum shared boundary length in feet
                                        to create an adjacency edge.
+    proximity_feet            : float  Tolerance-adjacency distance in feet
+                                       (default 200 ft, per spec #2); None
+                                       builds strict shared-boundary edges only.
+    out_graph_pickle          : str    Optional path for a gzipped pickle of
+                                       the graph (e.g. "AL_graph.pkl.gz") for
+                                       Python consumers that don't need
+                                       GerryChain's JSON; None skips it.
+    emit_json                 : bool   Write the two JSON outputs (default);
+                                       False skips encoding them entirely.
+    max_threads               : int    Thread budget for the parallel GEOS
+                                       steps (default: all CPUs); set it when
+                                       several builds share the machine.
     verbose                   : bool   Print graph QA stats when True.
 
     Returns
@@ -200,145 +341,237 @@ def build_precinct_adjacency_graph(
     gdf = gpd.read_file(precinct_geojson)
     gdf = gdf[[precinct_id_col, "geometry"] + [c for c in gdf.columns if c not in (precinct_id_col, "geometry")]].copy()
 
-    # Step 1: Clean geometries and reproject
-    gdf["geometry"] = gdf.geometry.buffer(0)
+    # Step 1: Clean geometries, reproject, and use positional row labels.
+    # Only invalid polygons are rebuilt with buffer(0) (it keeps the result
+    # polygonal, which the boundary math below needs); valid ones are left as-is.
+    invalid = ~gdf.geometry.is_valid
+    if invalid.any():
+        gdf.loc[invalid, "geometry"] = gdf.loc[invalid, "geometry"].buffer(0)
     gdf = gdf.to_crs(target_crs)
+    gdf = gdf.reset_index(drop=True)
 
-    # Step 2: Spatial index for candidate neighbor search
+    # Step 2: Spatial index for candidate neighbor search (built once and
+    # reused by the bulk query in Step 7)
     sindex = gdf.sindex
 
     G = nx.Graph()
 
-    # Step 3: Add nodes with all attributes except geometry
-    for _, row in gdf.iterrows():
-        attrs = row.drop("geometry").to_dict()
-        attrs = {k: sanitize_for_json(v) for k, v in attrs.items()}
-        node_id = str(row[precinct_id_col])
-        G.add_node(node_id, **attrs)
+    # Step 3: Add nodes with every attribute except geometry. Missing values
+    # are nulled column-wise up front, then the table is extracted as one list
+    # of records (Python scalars; no per-row Series)
+    node_ids = gdf[precinct_id_col].astype(str).tolist()
+    attrs_df = gdf.drop(columns="geometry")
+    attrs_df = attrs_df.astype(object).where(pd.notna(attrs_df), None)
+    records = attrs_df.to_dict(orient="records")
+    G.add_nodes_from(zip(node_ids, records))
 
     # Step 4: Adjacency parameters
     min_len_m = min_shared_boundary_feet * FEET_TO_METERS
 
-    # Spec #2 tolerance: "within 200 feet"
-    PROXIMITY_FEET = 200.0
-    tol_m = PROXIMITY_FEET * FEET_TO_METERS
-
-    # Step 5: Precompute boundaries + buffered boundaries once
-    # (much faster than buffering inside the loop)
-    gdf = gdf.reset_index(drop=True)
-    boundaries = gdf.geometry.boundary
-    buffered = gdf.geometry.buffer(tol_m)
-    buffered_boundaries = buffered.boundary
-
-    # Step 6: Re-build spatial index (after reset_index)
-    sindex = gdf.sindex
-
-    tolerance_edges_added = 0
+    # Spec #2 tolerance: "within 200 feet" (None disables the tolerance path)
+    tol_m = None if proximity_feet is None else proximity_feet * FEET_TO_METERS
+
+    # Step 5: Precompute boundaries once as a plain shapely geometry array
+    # (positional, so pairs index it directly with no pandas lookups). The
+    # buffered boundaries are only built later, for tolerance candidates.
+    geoms = np.asarray(gdf.geometry.values)
+    bnd = shapely.boundary(geoms)
+
+    # Preparing the polygons (in place, once) lets the predicate query below
+    # and every intersects test reuse GEOS' cached edge index instead of
+    # re-scanning both rings for each candidate pair
+    shapely.prepare(geoms)
+
+    # Step 7a: Candidates — one bulk STRtree query. With tolerance on, the
+    # "dwithin" predicate returns every pair within tol_m (touching or not)
+    # straight from GEOS, so no polygon has to be buffered just to widen its
+    # envelope; otherwise only intersecting pairs. Returns all (i, j) index
+    # pairs at once, in tree order; keep i < j to visit each pair once.
+    if tol_m is None:
+        left, right = sindex.query(geoms, predicate="intersects")
+    else:
+        left, right = sindex.query(geoms, predicate="dwithin", distance=tol_m)
+    keep = left < right
+    left, right = left[keep], right[keep]
+
+    # Fuzz factor to make near-coincident boundary segments intersect.
+    # 0.5m–2m is usually safe at EPSG:5070 scale; start small.
+    EPS_M = 1.0
 
     # Step 7: Build edges — true adjacency via shared boundary length >= 200 ft
-    # PLUS tolerance adjacency when polygons are within 200 ft but do not touch
-    for i, row_i in gdf.iterrows():
-        geom_i = row_i.geometry
-        node_i = str(row_i[precinct_id_col])
-
-        # Step 7a: Candidates — use buffered bounds so "nearby but not
-        # intersecting" pairs get considered
-        candidates = list(sindex.intersection(buffered.iloc[i].bounds))
-
-        for j in candidates:
-            if j <= i:
-                continue
-
-            geom_j = gdf.loc[j, "geometry"]
-            node_j = str(gdf.loc[j, precinct_id_col])
-
-            # Case 1: strict touching/intersecting adjacency
-            if geom_i.intersects(geom_j):
-                inter = boundaries.iloc[i].intersection(boundaries.iloc[j])
-                shared_len = float(inter.length)
-                if shared_len >= min_len_m:
-                    G.add_edge(node_i, node_j, shared_m=shared_len, tolerance=0)
-                continue
-
-            # Case 2: spec tolerance adjacency (within 200 ft)
-            if geom_i.distance(geom_j) <= tol_m:
-                bi = buffered.iloc[i].boundary
-                bj = buffered.iloc[j].boundary
-
-                # Fuzz factor to make near-coincident boundary segments intersect.
-                # 0.5m–2m is usually safe at EPSG:5070 scale; start small.
-                EPS_M = 1.0
-
-                shared_len_tol = float(bi.intersection(bj.buffer(EPS_M)).length)
-
-                if shared_len_tol >= min_len_m:
-                    G.add_edge(
-                        node_i, node_j,
-                        shared_m=shared_len_tol,
-                        tolerance=1,
-                        tol_m=tol_m,
-                        eps_m=EPS_M
-                    )
-                    tolerance_edges_added += 1
-
-    # Step 8: If still disconnected, connect remaining components with bridge edges
-    if nx.number_connected_components(G) > 1:
-        connect_components_to_largest(G, gdf, id_col=precinct_id_col)
-
-    # Step 9: Print component diagnostics
-    comps = list(nx.connected_components(G))
-    comps_sorted = sorted(comps, key=len, reverse=True)
+    # PLUS tolerance adjacency when polygons are within 200 ft but do not touch.
+    # Every predicate/measure runs once over all candidate pairs (vectorized
+    # GEOS calls, the heavier ones split across threads); only the final edge
+    # insertion is a Python loop.
+
+    # Case 1: strict touching/intersecting adjacency. The "intersects" query
+    # (tolerance off) already guarantees the predicate, so the re-check is
+    # only run on "dwithin" candidates.
+    if tol_m is None:
+        touching = np.ones(len(left), dtype=bool)
+    else:
+        touching = shapely.intersects(geoms[left], geoms[right])
+
+    # That was the last predicate call; drop the prepared indexes so the
+    # polygons handed to the thread pool below (tolerance buffers) are plain
+    # geometries and no lazily built GEOS state is shared between threads
+    shapely.destroy_prepared(geoms)
+
+    # Cheap bbox pre-filter (plain ndarray arithmetic, no GEOS): the shared
+    # boundary lies inside the overlap of the two bounding boxes. When that
+    # overlap is degenerate (a segment or a point, e.g. corner contacts) the
+    # shared length cannot exceed its longer side, so pairs whose longer side
+    # is under the minimum are settled without a boundary intersection. A
+    # full 2-D overlap gives no such bound and always gets the exact test.
+    bb = shapely.bounds(geoms)
+    ov_x = np.minimum(bb[left, 2], bb[right, 2]) - np.maximum(bb[left, 0], bb[right, 0])
+    ov_y = np.minimum(bb[left, 3], bb[right, 3]) - np.maximum(bb[left, 1], bb[right, 1])
+    too_short = (np.minimum(ov_x, ov_y) <= 0) & (np.maximum(ov_x, ov_y) < min_len_m)
+    measure = touching & ~too_short
+
+    shared = np.zeros(len(left))
+    shared[measure] = _threaded(
+        _overlap_length, bnd[left[measure]], bnd[right[measure]], max_workers=max_threads
+    )
+    strict = touching & (shared >= min_len_m)
+
+    # Case 2: spec tolerance adjacency (within 200 ft). Every non-touching
+    # candidate is already within tol_m; buffered boundaries (and their EPS
+    # fuzz) are built once per polygon that appears in such a pair. quad_segs
+    # is pinned to 16, the GeoSeries.buffer / geom.buffer default the edge
+    # lengths were defined with (shapely.buffer itself defaults to 8).
+    shared_tol = np.zeros(len(left))
+    tol = np.zeros(len(left), dtype=bool)
+    if tol_m is not None:
+        near = np.flatnonzero(~touching)
+        used = np.unique(np.concatenate([left[near], right[near]]))
+        buf_bnd = np.empty(len(geoms), dtype=object)
+        buf_bnd[used] = shapely.boundary(_threaded(
+            lambda g: shapely.buffer(g, tol_m, quad_segs=16), geoms[used], max_workers=max_threads
+        ))
+        rhs, rhs_inv = np.unique(right[near], return_inverse=True)
+        rhs_eps = _threaded(
+            lambda g: shapely.buffer(g, EPS_M, quad_segs=16), buf_bnd[rhs], max_workers=max_threads
+        )[rhs_inv]
+        shared_tol[near] = _threaded(
+            _overlap_length, buf_bnd[left[near]], rhs_eps, max_workers=max_threads
+        )
+        tol[near] = shared_tol[near] >= min_len_m
+
+    # Insert in candidate order (keeps the adjacency / JSON order stable)
+    for k in np.flatnonzero(strict | tol):
+        node_i = node_ids[left[k]]
+        node_j = node_ids[right[k]]
+        if strict[k]:
+            G.add_edge(node_i, node_j, shared_m=float(shared[k]), tolerance=0)
+        else:
+            G.add_edge(
+                node_i, node_j,
+                shared_m=float(shared_tol[k]),
+                tolerance=1,
+                tol_m=tol_m,
+                eps_m=EPS_M
+            )
+    tolerance_edges_added = int(tol.sum())
+
+    # Step 8: If still disconnected, connect remaining components with bridge
+    # edges (a no-op for an already connected graph)
+    connect_components_to_largest(G, gdf, id_col=precinct_id_col)
+
+    # Step 9: Print component diagnostics (components are labelled once here
+    # and reused by Step 10 and the QA block)
+    comps_sorted = _components_by_size(G)
     print("component sizes:", [len(c) for c in comps_sorted[:10]])
 
     # Step 10: Compute min distance from each small component to the largest
+    # (one KD-tree over the largest component's centroids, queried per component)
     largest = comps_sorted[0]
-    centroids = gdf.set_index(precinct_id_col).geometry.representative_point()
-
-    largest_list = list(largest)
-    for idx, comp in enumerate(comps_sorted[1:4], start=1):
-        best = None
-        for a in comp:
-            if a not in centroids.index:
-                continue
-            ca = centroids.loc[a]
-            d = centroids.loc[largest_list].distance(ca).min()
-            best = d if best is None else min(best, d)
-        print(f"min centroid dist to largest (component {idx}): {float(best):.2f} m")
-    print("tolerance threshold:", tol_m, "m")
+    if len(comps_sorted) > 1:
+        xy, _, pos = _centroid_coords(gdf, precinct_id_col)
+        tree = cKDTree(xy[[pos[b] for b in largest if b in pos]])
+        for idx, comp in enumerate(comps_sorted[1:4], start=1):
+            comp_idx = [pos[a] for a in comp if a in pos]
+            best = tree.query(xy[comp_idx])[0].min()
+            print(f"min centroid dist to largest (component {idx}): {float(best):.2f} m")
+    if tol_m is not None:
+        print("tolerance threshold:", tol_m, "m")
 
     if verbose:
         degrees = [d for _, d in G.degree()]
         print(f"\n== Graph QA (spec-compliant, no centroid bridges): {precinct_geojson} ==")
-        print("components:", nx.number_connected_components(G))
+        print("components:", len(comps_sorted))
         if degrees:
             print("degree min/median/max:", int(np.min(degrees)), float(np.median(degrees)), int(np.max(degrees)))
         print("tolerance edges added:", tolerance_edges_added)
 
-    # Step 11: Serialize and save node-link graph JSON
+    # Step 11: Optional binary snapshot: the pickled graph reloads without
+    # any JSON decoding or attribute sanitizing
+    if out_graph_pickle is not None:
+        with gzip.open(out_graph_pickle, "wb") as f:
+            pickle.dump(G, f, protocol=5)
+
+    if not emit_json:
+        return G
+
+    # Step 12: Serialize and save node-link graph JSON
+    # Node attributes were nulled in Step 3, so only stray numpy scalars need
+    # converting; the encoder hands just those to `_json_default` instead of
+    # a full sanitizing copy of the graph data being built first.
     data = json_graph.adjacency_data(G)
-    data = sanitize_obj(data)
-    with open(out_graph_json, "w") as f:
-        json.dump(data, f)
 
-    with open(out_graph_json2, "w") as f:
-        json.dump(data, f)
+    # json.dumps (no indent) goes through the C encoder; json.dump streams
+    # through the pure-Python iterencode path. Encode once (straight to
+    # bytes), write the same buffer to both destinations.
+    payload = json.dumps(data, default=_json_default).encode("utf-8")
+    for path in (out_graph_json, out_graph_json2):
+        with open(path, "wb") as f:
+            f.write(payload)
     return G
 
 
 # ── Script entry ──────────────────────────────────────────────────────────
 
-# Step 0: Build Alabama adjacency graph
-AL_G = build_precinct_adjacency_graph(
-    precinct_geojson="AL_data/AL_precincts_full.geojson",
-    out_graph_json="AL_data/AL_graph.json",
-    out_graph_json2="seawulf_runs/AL/input/AL_graph.json",
-    min_shared_boundary_feet=200,
-)
-
-# Step 1: Build Oregon adjacency graph
-OR_G = build_precinct_adjacency_graph(
-    precinct_geojson="OR_data/OR_precincts_full.geojson",
-    out_graph_json="OR_data/OR_graph.json",
-    out_graph_json2="seawulf_runs/OR/input/OR_graph.json",
-    min_shared_boundary_feet=200,
-)
+# Per-state inputs/outputs for the script entry below
+STATE_GRAPHS = {
+    "AL": {
+        "precinct_geojson": "AL_data/AL_precincts_full.geojson",
+        "out_graph_json": "AL_data/AL_graph.json",
+        "out_graph_json2": "seawulf_runs/AL/input/AL_graph.json",
+        "min_shared_boundary_feet": 200,
+    },
+    "OR": {
+        "precinct_geojson": "OR_data/OR_precincts_full.geojson",
+        "out_graph_json": "OR_data/OR_graph.json",
+        "out_graph_json2": "seawulf_runs/OR/input/OR_graph.json",
+        "min_shared_boundary_feet": 200,
+    },
+}
+
+
+def build_state_graph(state_code: str, max_threads: Optional[int] = None) -> tuple:
+    """
+    Build and write the adjacency graph for one state in STATE_GRAPHS
+    (top-level so it can be sent to a worker process). `max_threads` caps the
+    GEOS thread pool inside that build.
+
+    Only the output paths are returned: the graph itself is already on disk,
+    and sending it back would pickle the whole nx.Graph across processes.
+    """
+    cfg = STATE_GRAPHS[state_code]
+    build_precinct_adjacency_graph(**cfg, max_threads=max_threads)
+    return cfg["out_graph_json"], cfg["out_graph_json2"]
+
+
+if __name__ == "__main__":
+    # Steps 0-1: Build the Alabama and Oregon adjacency graphs. The states are
+    # independent, so each runs in its own process (GEOS work and file IO
+    # overlap; threads would serialize on the GIL outside GEOS calls). The
+    # CPUs are split between the two processes so their GEOS thread pools
+    # don't oversubscribe the machine. Iterating the results re-raises any
+    # worker exception here.
+    states = ["AL", "OR"]
+    threads = max(1, (os.cpu_count() or 1) // len(states))
+    with ProcessPoolExecutor(max_workers=len(states)) as ex:
+        results = ex.map(build_state_graph, states, [threads] * len(states))
+        for state_code, paths in zip(states, results):
+            print(f"{state_code} graph written to:", ", ".join(paths))
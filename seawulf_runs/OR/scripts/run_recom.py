@@ -9,6 +9,10 @@ from gerrychain.proposals import recom
 from functools import partial
 from gerrychain.tree import bipartition_tree
 
+# Write buffer for the per-step JSONL outputs: records are flushed in ~1 MiB
+# blocks instead of the default 8 KiB, so long chains make far fewer syscalls
+JSONL_BUFFER = 1 << 20
+
 def load_config(path):
     with open(path, "r") as f:
         return json.load(f)
@@ -16,10 +20,11 @@ def load_config(path):
 def ensure_dir(p):
     os.makedirs(p, exist_ok=True)
 
-def district_effectiveness_record(part, dist, group_key, thr, party):
+def district_effectiveness_record(part, dist, group_key, thr, party, pct=None):
     pop = part["population"][dist]
     minority = part["min_{}".format(group_key)][dist]
-    pct = 0.0 if pop <= 0 else float(minority) / float(pop)
+    if pct is None:
+        pct = 0.0 if pop <= 0 else float(minority) / float(pop)
 
     dem = part["dem"][dist] if "dem" in part.updaters else None
     rep = part["rep"][dist] if "rep" in part.updaters else None
@@ -125,20 +130,29 @@ def main():
         m = part["min_{}".format(group_key)][dist]
         return float(m) / float(pop)
 
-    def opp_count(part, thr, group_key):
-        return sum(
-            1 for dist in part.parts
-            if district_minority_pct(part, dist, group_key) >= thr
-        )
+    def minority_pcts(part, group_key):
+        # one minority share per district; computed once per step and shared
+        # by the plan metrics, box/whisker rows and effectiveness rows
+        return {
+            dist: district_minority_pct(part, dist, group_key)
+            for dist in part.parts
+        }
+
+    def opp_count(part, thr, group_key, pcts=None):
+        if pcts is None:
+            pcts = minority_pcts(part, group_key)
+        return sum(1 for pct in pcts.values() if pct >= thr)
 
-    def effective_count(part, thr, group_key, party):
+    def effective_count(part, thr, group_key, party, pcts=None):
         # effective = opportunity + party-of-choice wins district (simple version)
         if ("dem" not in part.updaters) or ("rep" not in part.updaters):
             return 0
 
+        if pcts is None:
+            pcts = minority_pcts(part, group_key)
         c = 0
         for dist in part.parts:
-            if district_minority_pct(part, dist, group_key) < thr:
+            if pcts[dist] < thr:
                 continue
             dem = part["dem"][dist]
             rep = part["rep"][dist]
@@ -157,7 +171,7 @@ def main():
         rep_seats = len(part.parts) - dem_seats
         return dem_seats, rep_seats
 
-    def plan_metrics(part, group_key=None, thr=None, party=None):
+    def plan_metrics(part, group_key=None, thr=None, party=None, pcts=None):
         dem_seats, rep_seats = seat_count(part)
         cut = len(part["cut_edges"]) if "cut_edges" in part.updaters else None
 
@@ -168,9 +182,9 @@ def main():
         }
 
         if group_key is not None and thr is not None:
-            metrics["opp_districts"] = opp_count(part, thr, group_key)
+            metrics["opp_districts"] = opp_count(part, thr, group_key, pcts)
             if party is not None:
-                metrics["eff_districts"] = effective_count(part, thr, group_key, party)
+                metrics["eff_districts"] = effective_count(part, thr, group_key, party, pcts)
 
         return metrics
 
@@ -264,9 +278,9 @@ def main():
     save_first_n = int(cfg.get("save_assignments_first_n", 10))
     save_every = int(cfg.get("save_assignments_every", 0))
 
-    with open(plans_path, "w") as fout, \
-     open(box_path, "w") as fbox, \
-     open(district_eff_path, "w") as feff:
+    with open(plans_path, "w", buffering=JSONL_BUFFER) as fout, \
+     open(box_path, "w", buffering=JSONL_BUFFER) as fbox, \
+     open(district_eff_path, "w", buffering=JSONL_BUFFER) as feff:
         for i, part in enumerate(chain):
             rec = {"step": i}
 
@@ -285,11 +299,15 @@ def main():
                 metrics_thr = boxwhisker_thresholds.get(metrics_group)
                 metrics_party = boxwhisker_parties.get(metrics_group)
 
+            # Minority share of every district, once per group for this step
+            step_pcts = {gk: minority_pcts(part, gk) for gk in boxwhisker_group_keys}
+
             metrics = plan_metrics(
                 part,
                 group_key=metrics_group,
                 thr=metrics_thr,
                 party=metrics_party,
+                pcts=step_pcts.get(metrics_group),
             )
             rec.update({k: v for k, v in metrics.items() if v is not None})
 
@@ -322,9 +340,7 @@ def main():
             dists = sorted(part.parts.keys(), key=lambda x: int(x) if str(x).isdigit() else str(x))
 
             for bw_group in boxwhisker_group_keys:
-                district_pcts_sorted = sorted(
-                    district_minority_pct(part, d, bw_group) for d in dists
-                )
+                district_pcts_sorted = sorted(step_pcts[bw_group][d] for d in dists)
 
                 fbox.write(json.dumps({
                     "step": i,
@@ -337,6 +353,8 @@ def main():
 
             # ---- per-district effectiveness records ----
             # Only write rows for groups that actually have a threshold.
+            # The step's rows are joined and written with a single call.
+            eff_lines = []
             for bw_group in boxwhisker_group_keys:
                 bw_threshold = boxwhisker_thresholds.get(bw_group)
                 bw_party = boxwhisker_parties.get(bw_group)
@@ -351,10 +369,12 @@ def main():
                         bw_group,
                         bw_threshold,
                         bw_party,
+                        pct=step_pcts[bw_group][d],
                     )
                     eff_rec["step"] = i
-                    feff.write(json.dumps(eff_rec) + "\n")
-                    district_eff_written += 1
+                    eff_lines.append(json.dumps(eff_rec) + "\n")
+            feff.write("".join(eff_lines))
+            district_eff_written += len(eff_lines)
 
             fout.write(json.dumps(rec) + "\n")
             plans_written += 1
@@ -0,0 +1,93 @@
+"""
+test_precinct_graph.py
+======================
+Regression tests for precinctGraph.build_precinct_adjacency_graph.
+
+Run from the repository root:  python -m unittest discover -s tests -t .
+"""
+
+import os
+import tempfile
+import unittest
+
+import geopandas as gpd
+import shapely
+from shapely import affinity
+
+import precinctGraph as pg
+
+
+def _reference_tolerance_lengths(gdf: gpd.GeoDataFrame, tol_m: float, eps_m: float = 1.0) -> dict:
+    """
+    Tolerance-edge lengths computed the way the original per-pair loop did:
+    GeoSeries.buffer(tol_m) boundaries, the right-hand one fuzzed with
+    geom.buffer(eps_m), for every non-touching pair within tol_m.
+    """
+    buffered_boundaries = gdf.geometry.buffer(tol_m).boundary
+    geoms = gdf.geometry.tolist()
+    ids = gdf["GEOID"].tolist()
+    out = {}
+    for i in range(len(geoms)):
+        for j in range(i + 1, len(geoms)):
+            if geoms[i].intersects(geoms[j]) or geoms[i].distance(geoms[j]) > tol_m:
+                continue
+            bi = buffered_boundaries.iloc[i]
+            bj = buffered_boundaries.iloc[j]
+            out[frozenset((ids[i], ids[j]))] = float(bi.intersection(bj.buffer(eps_m)).length)
+    return out
+
+
+class ToleranceEdgeTest(unittest.TestCase):
+
+    def setUp(self):
+        # Non-touching pairs in a projected CRS: near-parallel rectangles
+        # (slightly rotated, so the buffer corners matter), two circles and a
+        # rectangle facing a circle, each separated by a gap under 200 ft
+        rect = shapely.box(0, 0, 400, 150)
+        geoms = [
+            rect,
+            affinity.rotate(affinity.translate(rect, 0, 170), 3, origin=(200, 245)),
+            shapely.Point(1500, 75).buffer(120),
+            shapely.Point(1770, 90).buffer(140),
+            shapely.box(1300, 300, 1700, 380),
+        ]
+        gdf = gpd.GeoDataFrame(
+            {"GEOID": [f"P{k}" for k in range(len(geoms))]}, geometry=geoms, crs="EPSG:5070"
+        )
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "precincts.geojson")
+        gdf.to_file(self.path, driver="GeoJSON")
+        self.gdf = gpd.read_file(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tolerance_shared_m_matches_per_pair_buffers(self):
+        tol_m = 200.0 * pg.FEET_TO_METERS
+        expected = _reference_tolerance_lengths(self.gdf, tol_m)
+        self.assertTrue(expected, "fixture has no non-touching pairs within tolerance")
+
+        # A 1 ft threshold turns every non-degenerate tolerance pair into an
+        # edge, so all measured lengths can be compared
+        G = pg.build_precinct_adjacency_graph(
+            self.path,
+            os.path.join(self.tmp.name, "g1.json"),
+            os.path.join(self.tmp.name, "g2.json"),
+            min_shared_boundary_feet=1.0,
+            emit_json=False,
+            verbose=False,
+        )
+        actual = {
+            frozenset((u, v)): d["shared_m"]
+            for u, v, d in G.edges(data=True)
+            if d.get("tolerance") == 1
+        }
+
+        min_len_m = 1.0 * pg.FEET_TO_METERS
+        self.assertEqual(set(actual), {k for k, v in expected.items() if v >= min_len_m})
+        for pair, length in actual.items():
+            self.assertAlmostEqual(length, expected[pair], places=6, msg=sorted(pair))
+
+
+if __name__ == "__main__":
+    unittest.main()
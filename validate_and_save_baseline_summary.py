@@ -7,7 +7,8 @@ used as the reference point for ensemble comparison.
 
 Script sections
 ---------------
-1. Load AL and OR graphs from JSON and check for missing required node attributes.
+1. Load AL and OR graphs from JSON (parsed once per path and cached) and
+   check for missing required node attributes.
 2. Build enacted partitions using the VAP, votes_dem, and votes_rep tallies;
    print district counts and total population as sanity checks.
 3. `save_enacted_baseline` — for each state, compute per-district stats
@@ -19,12 +20,24 @@ Dependencies: json, gerrychain
 """
 
 import json
+from functools import lru_cache
 from gerrychain import Graph, Partition
 from gerrychain.updaters import Tally
 
+
+@lru_cache(maxsize=8)
+def _load_graph(graph_path):
+    """
+    Parse a precinct adjacency graph JSON once per path. The QA section,
+    `save_enacted_baseline` and `save_starting_assignment` all read the same
+    two graphs, so later calls reuse the already-built Graph (read-only).
+    """
+    return Graph.from_json(graph_path)
+
+
 # ── Step 0: Load precinct adjacency graphs ────────────────────────────────
-AL_graph = Graph.from_json("AL_data/AL_graph.json")
-OR_graph = Graph.from_json("OR_data/OR_graph.json")
+AL_graph = _load_graph("AL_data/AL_graph.json")
+OR_graph = _load_graph("OR_data/OR_graph.json")
 
 # ── Step 1: Required node attributes ─────────────────────────────────────
 # These must be present on every precinct node for the chain and analytics
@@ -102,7 +115,7 @@ def save_enacted_baseline(graph_path, out_json, out_json2, num_districts):
     num_districts : int  Expected number of congressional districts.
     """
     # Step 6a: Load graph and build updaters
-    G = Graph.from_json(graph_path)
+    G = _load_graph(graph_path)
 
     updaters = {
         "pop": Tally("VAP"),
@@ -171,7 +184,7 @@ save_enacted_baseline(
 )
 
 def save_starting_assignment(graph_path, out_path, out_path2, assignment_col="enacted_cd"):
-    G = Graph.from_json(graph_path)
+    G = _load_graph(graph_path)
 
     assignment = {}
     missing = 0